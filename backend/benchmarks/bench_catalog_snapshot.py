@@ -0,0 +1,136 @@
+"""Benchmark the memory-mapped catalog snapshot against the ORM path.
+
+    python benchmarks/bench_catalog_snapshot.py --products 20000 --workers 4
+
+Seeds a throwaway SQLite catalog, compares request latency for the product
+endpoints with and without CATALOG_SNAPSHOT, then runs gunicorn in both
+modes and reports per-worker RSS/PSS after every worker has served the full
+product list. Linux only (reads /proc).
+"""
+import argparse
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+BACKEND_DIR = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, BACKEND_DIR)
+sys.path.insert(0, BENCH_DIR)
+
+# Never point the benchmark at a real database
+_tmpdir = tempfile.mkdtemp()
+os.environ['DATABASE_URL'] = f"sqlite:///{os.path.join(_tmpdir, 'bench.db')}"
+os.environ['CATALOG_SNAPSHOT_PATH'] = os.path.join(_tmpdir, 'catalog.snapshot')
+
+from bench_startup import children, free_port, memory_kb  # noqa: E402
+
+CATEGORIES = ['over-ear', 'in-ear', 'wireless', 'gaming', 'studio', 'sport', 'kids', 'accessories']
+
+
+def seed(count):
+    from app import app
+    from extensions import db
+    from models import Product
+
+    rng = random.Random(0)
+    with app.app_context():
+        db.create_all()
+        db.session.execute(Product.__table__.insert(), [{
+            'name': f'Headphone model {i}',
+            'description': 'Closed-back dynamic driver with detachable cable. ' * rng.randint(2, 10),
+            'price': round(rng.uniform(10, 500), 2),
+            'category': rng.choice(CATEGORIES),
+            'image': f'https://images.example.com/products/{i}.jpg',
+            'stock': rng.randint(0, 100),
+            'featured': rng.random() < 0.05,
+        } for i in range(count)])
+        db.session.commit()
+    return app
+
+
+def time_path(client, path, runs):
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        response = client.get(path)
+        samples.append(time.perf_counter() - start)
+        assert response.status_code == 200, (path, response.status_code)
+    return statistics.median(samples) * 1000
+
+
+def bench_latency(app, products, runs):
+    from blueprints.catalog import build_catalog_snapshot
+
+    paths = [
+        '/api/products',
+        '/api/products?featured=true&limit=10',
+        '/api/products?category=wireless&sort=price_asc&limit=20',
+        f'/api/products/{products // 2}',
+    ]
+    client = app.test_client()
+    results = {}
+    for mode in ('orm', 'snapshot'):
+        app.config['CATALOG_SNAPSHOT'] = mode == 'snapshot'
+        app.config['CATALOG_CACHE_TTL'] = 0  # measure the ORM itself, not the per-worker cache
+        if mode == 'snapshot':
+            with app.app_context():
+                build_catalog_snapshot()
+        results[mode] = [time_path(client, path, runs) for path in paths]
+
+    print(f'{"path":<58} {"orm ms":>8} {"snapshot ms":>12}')
+    for i, path in enumerate(paths):
+        print(f'{path:<58} {results["orm"][i]:8.2f} {results["snapshot"][i]:12.2f}')
+
+
+def bench_memory(workers, snapshot):
+    port = free_port()
+    env = dict(os.environ, CATALOG_SNAPSHOT='1' if snapshot else '0', WARMUP='1')
+    proc = subprocess.Popen(
+        [sys.executable, '-m', 'gunicorn', '-c', 'gunicorn.conf.py',
+         '-w', str(workers), '-b', f'127.0.0.1:{port}', 'app:app'],
+        cwd=BACKEND_DIR, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        url = f'http://127.0.0.1:{port}/api/products'
+        deadline = time.time() + 60
+        while True:
+            try:
+                urllib.request.urlopen(url, timeout=30).read()
+                break
+            except OSError:
+                if time.time() > deadline:
+                    raise
+                time.sleep(0.05)
+        # Enough requests that every worker has served (and cached) the full list
+        for _ in range(workers * 6):
+            urllib.request.urlopen(url, timeout=30).read()
+
+        worker_memory = [memory_kb(pid) for pid in children(proc.pid)]
+        rss = statistics.mean(m[0] for m in worker_memory) / 1024
+        pss = statistics.mean(m[1] for m in worker_memory) / 1024
+        print(f'{"snapshot" if snapshot else "orm":>8}: worker RSS avg {rss:.1f} MB, PSS avg {pss:.1f} MB')
+    finally:
+        proc.terminate()
+        proc.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--products', type=int, default=20_000)
+    parser.add_argument('--runs', type=int, default=20)
+    parser.add_argument('--workers', type=int, default=4)
+    args = parser.parse_args()
+
+    app = seed(args.products)
+    print(f'{args.products:,} products')
+    bench_latency(app, args.products, args.runs)
+    for snapshot in (False, True):
+        bench_memory(args.workers, snapshot)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,120 @@
+"""Benchmark building the co-occurrence matrix from synthetic order history.
+
+    python benchmarks/bench_recommendations.py --line-items 10000000 --db-items 1000000
+
+`--db-items` also seeds a throwaway SQLite database and times loading the
+line items into arrays (the DB-to-array step of `flask recommendations`).
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Never point the benchmark at a real database
+_tmpdir = tempfile.mkdtemp()
+os.environ['DATABASE_URL'] = f"sqlite:///{os.path.join(_tmpdir, 'bench.db')}"
+
+import recommendations  # noqa: E402
+
+
+def synthetic_line_items(n_items, n_products, avg_basket, seed=0):
+    """Orders with Poisson-sized baskets and Zipf-skewed product popularity."""
+    rng = np.random.default_rng(seed)
+    basket_sizes = rng.poisson(avg_basket - 1, size=n_items // avg_basket + 1) + 1
+    order_ids = np.repeat(np.arange(basket_sizes.size), basket_sizes)[:n_items]
+    product_ids = (rng.zipf(1.3, size=order_ids.size) - 1) % n_products
+    return order_ids, product_ids
+
+
+def bench_db_load(n_items, n_products, avg_basket):
+    from app import app
+    from commands import paid_line_items
+    from extensions import db
+    from models import User, Order, OrderItem, Product
+
+    order_ids, product_ids = synthetic_line_items(n_items, n_products, avg_basket)
+    with app.app_context():
+        db.create_all()
+        db.session.add(User(id=1, name='Bench', email='bench@example.com', password_hash='x'))
+        db.session.execute(Product.__table__.insert(), [
+            {'id': i, 'name': f'P{i}', 'price': 1.0, 'category': 'bench', 'stock': 1}
+            for i in range(n_products)])
+        db.session.execute(Order.__table__.insert(), [
+            {'id': int(o) + 1, 'user_id': 1, 'total_amount': 1.0, 'status': 'paid',
+             'razorpay_payment_id': 'pay'}
+            for o in np.unique(order_ids)])
+        db.session.execute(OrderItem.__table__.insert(), [
+            {'order_id': int(o) + 1, 'product_id': int(p), 'quantity': 1, 'price': 1.0}
+            for o, p in zip(order_ids, product_ids)])
+        db.session.commit()
+
+        for name, load in (('materialised .all()', _load_all), ('streamed', paid_line_items)):
+            db.session.expire_all()
+            tracemalloc.start()
+            start = time.perf_counter()
+            loaded, _ = load()
+            elapsed = time.perf_counter() - start
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            assert loaded.size == n_items, loaded.size
+            print(f'db -> arrays [{name}]: {elapsed:.2f}s, peak {peak / 2**20:.0f} MiB')
+
+
+def _load_all():
+    """The old approach: one Python tuple per line item, then np.array."""
+    from extensions import db
+    from models import Order, OrderItem
+
+    rows = db.session.query(OrderItem.order_id, OrderItem.product_id) \
+        .join(Order, OrderItem.order_id == Order.id) \
+        .filter(Order.razorpay_payment_id.isnot(None), Order.status != 'cancelled') \
+        .all()
+    pairs = np.array(rows, dtype=np.int64)
+    return pairs[:, 0], pairs[:, 1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--line-items', type=int, default=10_000_000)
+    parser.add_argument('--products', type=int, default=5_000)
+    parser.add_argument('--avg-basket', type=int, default=3)
+    parser.add_argument('--top-k', type=int, default=10)
+    parser.add_argument('--db-items', type=int, default=0,
+                        help='also time loading this many line items from SQLite')
+    args = parser.parse_args()
+
+    order_ids, product_ids = synthetic_line_items(args.line_items, args.products, args.avg_basket)
+    print(f'{order_ids.size:,} line items, {order_ids[-1] + 1:,} orders, {args.products:,} products')
+
+    start = time.perf_counter()
+    cooccurrence, order_count = recommendations.build_cooccurrence(order_ids, product_ids, args.products)
+    build_time = time.perf_counter() - start
+    print(f'build_cooccurrence: {build_time:.2f}s ({cooccurrence.nnz:,} non-zeros)')
+
+    for scorer in recommendations.SCORERS:
+        start = time.perf_counter()
+        scored = sum(1 for _ in recommendations.top_k(cooccurrence, order_count, k=args.top_k, scorer=scorer))
+        print(f'top_k[{scorer}]: {time.perf_counter() - start:.2f}s for {scored:,} products')
+
+    # Incremental: fold in 1% more orders and rescore only the touched rows
+    new_orders, new_products = synthetic_line_items(args.line_items // 100, args.products, args.avg_basket, seed=1)
+    start = time.perf_counter()
+    delta, delta_orders = recommendations.build_cooccurrence(new_orders, new_products, args.products)
+    merged = cooccurrence + delta
+    touched = np.unique(new_products)
+    rows = np.union1d(touched, merged[touched].indices)
+    rescored = sum(1 for _ in recommendations.top_k(merged, order_count + delta_orders, k=args.top_k, rows=rows))
+    print(f'incremental (+{new_orders.size:,} items): {time.perf_counter() - start:.2f}s, rescored {rescored:,} products')
+
+    if args.db_items:
+        bench_db_load(args.db_items, args.products, args.avg_basket)
+
+
+if __name__ == '__main__':
+    main()
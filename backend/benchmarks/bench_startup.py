@@ -0,0 +1,111 @@
+"""Benchmark backend startup: import time, time-to-first-request and per-worker memory.
+
+    python benchmarks/bench_startup.py --workers 4 --path /api/products
+
+Runs gunicorn with and without --preload (GUNICORN_PRELOAD) and reports RSS
+and PSS per worker; PSS divides shared pages between the processes mapping
+them, so it shows how much copy-on-write sharing preload buys. Linux only.
+"""
+import argparse
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+IMPORT_SNIPPET = 'import time; t = time.perf_counter(); import app; print(time.perf_counter() - t)'
+
+
+def import_time(runs):
+    samples = []
+    for _ in range(runs):
+        out = subprocess.run([sys.executable, '-c', IMPORT_SNIPPET], cwd=BACKEND_DIR,
+                             capture_output=True, text=True, check=True).stdout
+        samples.append(float(out.strip().splitlines()[-1]))
+    return statistics.median(samples)
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def memory_kb(pid):
+    """Return (rss, pss) in kB for a process."""
+    values = {}
+    with open(f'/proc/{pid}/smaps_rollup') as f:
+        for line in f:
+            parts = line.split()
+            if parts[0] in ('Rss:', 'Pss:'):
+                values[parts[0]] = int(parts[1])
+    return values['Rss:'], values['Pss:']
+
+
+def children(pid):
+    with open(f'/proc/{pid}/task/{pid}/children') as f:
+        return [int(p) for p in f.read().split()]
+
+
+def run_gunicorn(workers, path, preload, warmup, timeout=60):
+    port = free_port()
+    env = dict(os.environ, GUNICORN_PRELOAD='1' if preload else '0', WARMUP='1' if warmup else '0')
+    start = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, '-m', 'gunicorn', '-c', 'gunicorn.conf.py',
+         '-w', str(workers), '-b', f'127.0.0.1:{port}', 'app:app'],
+        cwd=BACKEND_DIR, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        url = f'http://127.0.0.1:{port}{path}'
+        while True:
+            if time.perf_counter() - start > timeout:
+                raise RuntimeError(f'no response from {url} within {timeout}s')
+            try:
+                urllib.request.urlopen(url, timeout=5).read()
+                break
+            except (urllib.error.URLError, ConnectionError):
+                time.sleep(0.01)
+        first_request = time.perf_counter() - start
+
+        # Let every worker finish booting and serve a few requests before sampling
+        deadline = time.perf_counter() + timeout
+        while len(children(proc.pid)) < workers and time.perf_counter() < deadline:
+            time.sleep(0.05)
+        for _ in range(workers * 4):
+            urllib.request.urlopen(url, timeout=5).read()
+
+        worker_memory = [memory_kb(pid) for pid in children(proc.pid)]
+        return first_request, memory_kb(proc.pid), worker_memory
+    finally:
+        proc.terminate()
+        proc.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--path', default='/', help='URL used for time-to-first-request')
+    parser.add_argument('--import-runs', type=int, default=5)
+    parser.add_argument('--warmup', action='store_true', help='Set WARMUP=1 (needs a reachable DB)')
+    args = parser.parse_args()
+
+    print(f'import app: {import_time(args.import_runs) * 1000:.0f} ms (median of {args.import_runs})')
+
+    for preload in (False, True):
+        first_request, master, workers = run_gunicorn(args.workers, args.path, preload, args.warmup)
+        rss = [w[0] for w in workers]
+        pss = [w[1] for w in workers]
+        print(f'preload={"on " if preload else "off"} first request: {first_request * 1000:.0f} ms | '
+              f'master RSS {master[0] / 1024:.1f} MB | '
+              f'worker RSS avg {statistics.mean(rss) / 1024:.1f} MB, '
+              f'PSS avg {statistics.mean(pss) / 1024:.1f} MB, '
+              f'PSS total {(sum(pss) + master[1]) / 1024:.1f} MB')
+
+
+if __name__ == '__main__':
+    main()
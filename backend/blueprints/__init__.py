@@ -0,0 +1,8 @@
+from blueprints.auth import auth_bp
+from blueprints.catalog import catalog_bp
+from blueprints.orders import orders_bp
+from blueprints.admin import admin_bp
+from blueprints.delivery import delivery_bp
+from blueprints.events import events_bp
+
+ALL_BLUEPRINTS = (auth_bp, catalog_bp, orders_bp, admin_bp, delivery_bp, events_bp)
@@ -0,0 +1,174 @@
+from flask import Blueprint, request, jsonify
+from flask_jwt_extended import jwt_required, get_jwt_identity
+
+from extensions import db, publish_event
+from models import User, Product, Order, ArchivedOrder, OrderArchiveSummary, Setting, find_order
+from revocation import revoke_user_sessions
+
+admin_bp = Blueprint('admin', __name__)
+
+
+@admin_bp.route('/api/admin/stats', methods=['GET'])
+@jwt_required()
+def get_admin_stats():
+    user_id = get_jwt_identity()
+    user = User.query.get(user_id)
+    
+    if user.role != 'admin':
+        return jsonify({'message': 'Admin access required'}), 403
+    
+    total_products = Product.query.count()
+    total_users = User.query.count()
+    hot_orders, hot_revenue = db.session.query(
+        db.func.count(Order.id), db.func.sum(Order.total_amount)).one()
+    archive = OrderArchiveSummary.query.get(1)
+    total_orders = hot_orders + (archive.order_count if archive else 0)
+    total_revenue = (hot_revenue or 0) + (archive.revenue if archive else 0)
+    
+    return jsonify({
+        'totalProducts': total_products,
+        'totalOrders': total_orders,
+        'totalUsers': total_users,
+        'totalRevenue': total_revenue
+    })
+
+@admin_bp.route('/api/admin/recent-orders', methods=['GET'])
+@jwt_required()
+def get_recent_orders():
+    user_id = get_jwt_identity()
+    user = User.query.get(user_id)
+    
+    if user.role != 'admin':
+        return jsonify({'message': 'Admin access required'}), 403
+    
+    orders = db.session.query(Order, User).join(User).order_by(Order.created_at.desc()).limit(10).all()
+    
+    return jsonify([{
+        'id': o.Order.id,
+        'customerName': o.User.name,
+        'totalAmount': o.Order.total_amount,
+        'status': o.Order.status,
+        'createdAt': o.Order.created_at.isoformat()
+    } for o in orders])
+
+@admin_bp.route('/api/admin/orders', methods=['GET'])
+@jwt_required()
+def get_admin_orders():
+    user_id = get_jwt_identity()
+    user = User.query.get(user_id)
+    
+    if user.role != 'admin':
+        return jsonify({'message': 'Admin access required'}), 403
+    
+    orders = db.session.query(Order, User).join(User).order_by(Order.created_at.desc()).all()
+    
+    return jsonify([{
+        'id': o.Order.id,
+        'customerName': o.User.name,
+        'customerEmail': o.User.email,
+        'totalAmount': o.Order.total_amount,
+        'status': o.Order.status,
+        'createdAt': o.Order.created_at.isoformat()
+    } for o in orders])
+
+@admin_bp.route("/api/admin/orders/<int:order_id>", methods=["GET"])
+@jwt_required()
+def get_order(order_id):
+    user_id = get_jwt_identity()
+    user = User.query.get(user_id)
+
+    if user.role != 'admin':
+        return jsonify({'message': 'Admin access required'}), 403
+
+    order = find_order(order_id)
+    if not order:
+        return {"message": "Order not found"}, 404
+    return order.to_dict()  # make sure you have a method to serialize the order
+
+@admin_bp.route('/api/admin/orders/<int:order_id>/status', methods=['PUT'])
+@jwt_required()
+def update_order_status(order_id):
+    user_id = get_jwt_identity()
+    user = User.query.get(user_id)
+    
+    if user.role != 'admin':
+        return jsonify({'message': 'Admin access required'}), 403
+    
+    # Waits for an in-flight archive batch holding this row, then sees it gone
+    order = Order.query.with_for_update().get(order_id)
+    if not order:
+        if ArchivedOrder.query.get(order_id):
+            return jsonify({'message': 'Archived orders cannot be updated'}), 409
+        return jsonify({'message': 'Order not found'}), 404
+    data = request.get_json()
+    
+    order.status = data['status']
+    db.session.commit()
+    publish_event({'type': 'order_status', 'orderId': order.id,
+                   'userId': order.user_id, 'status': order.status})
+    
+    return jsonify({'message': 'Order status updated successfully'})
+
+@admin_bp.route('/api/admin/users/<int:target_id>/revoke-sessions', methods=['POST'])
+@jwt_required()
+def revoke_sessions(target_id):
+    user_id = get_jwt_identity()
+    user = User.query.get(user_id)
+    
+    if user.role != 'admin':
+        return jsonify({'message': 'Admin access required'}), 403
+    
+    target = User.query.get_or_404(target_id)
+    revoke_user_sessions(target)
+    
+    return jsonify({'message': 'All sessions revoked for user'})
+
+@admin_bp.route('/api/admin/analytics', methods=['GET'])
+@jwt_required()
+def get_analytics():
+    user_id = get_jwt_identity()
+    user = User.query.get(user_id)
+    
+    if user.role != 'admin':
+        return jsonify({'message': 'Admin access required'}), 403
+    
+    # Mock analytics data
+    return jsonify({
+        
+    })
+
+
+# ✅ GET all settings
+@admin_bp.route('/api/admin/settings', methods=['GET'])
+def get_settings():
+    settings = Setting.query.all()
+    return jsonify([{
+        "id": s.id,
+        "site_name": s.site_name,
+        "contact_email": s.contact_email,
+        "phone": s.phone
+    } for s in settings])
+
+# ✅ POST new settings
+@admin_bp.route('/api/admin/settings', methods=['POST'])
+def create_setting():
+    data = request.json
+    new_setting = Setting(
+        site_name=data.get("site_name"),
+        contact_email=data.get("contact_email"),
+        phone=data.get("phone")
+    )
+    db.session.add(new_setting)
+    db.session.commit()
+    return jsonify({"message": "Setting saved successfully"}), 201
+
+# ✅ PUT update existing setting
+@admin_bp.route('/api/admin/settings/<int:id>', methods=['PUT'])
+def update_setting(id):
+    setting = Setting.query.get_or_404(id)
+    data = request.json
+    setting.site_name = data.get("site_name", setting.site_name)
+    setting.contact_email = data.get("contact_email", setting.contact_email)
+    setting.phone = data.get("phone", setting.phone)
+    db.session.commit()
+    return jsonify({"message": "Setting updated successfully"})
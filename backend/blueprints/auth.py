@@ -0,0 +1,58 @@
+from flask import Blueprint, request, jsonify
+from flask_jwt_extended import create_access_token, jwt_required, get_jwt_identity, get_jwt
+from werkzeug.security import generate_password_hash, check_password_hash
+
+from extensions import db
+from models import User
+from revocation import revoke_token
+
+auth_bp = Blueprint('auth', __name__)
+
+
+@auth_bp.route('/api/auth/register', methods=['POST'])
+def register():
+    data = request.get_json()
+    
+    if User.query.filter_by(email=data['email']).first():
+        return jsonify({'message': 'Email already exists'}), 400
+    
+    user = User(
+        name=data['name'],
+        email=data['email'],
+        password_hash=generate_password_hash(data['password'])
+    )
+    db.session.add(user)
+    db.session.commit()
+    
+    token = create_access_token(identity=user.id)
+    return jsonify({
+        'token': token,
+        'user': {'id': user.id, 'name': user.name, 'email': user.email, 'role': user.role}
+    })
+
+@auth_bp.route('/api/auth/login', methods=['POST'])
+def login():
+    data = request.get_json()
+    user = User.query.filter_by(email=data['email']).first()
+    
+    if user and check_password_hash(user.password_hash, data['password']):
+        token = create_access_token(identity=str(user.id))
+        return jsonify({
+            'token': token,
+            'user': {'id': user.id, 'name': user.name, 'email': user.email, 'role': user.role}
+        })
+    
+    return jsonify({'message': 'Invalid credentials'}), 401
+
+@auth_bp.route('/api/auth/me', methods=['GET'])
+@jwt_required()
+def get_user():
+    user_id = get_jwt_identity()
+    user = User.query.get(user_id)
+    return jsonify({'id': user.id, 'name': user.name, 'email': user.email, 'role': user.role})
+
+@auth_bp.route('/api/auth/logout', methods=['POST'])
+@jwt_required()
+def logout():
+    revoke_token(get_jwt())
+    return jsonify({'message': 'Logged out'})
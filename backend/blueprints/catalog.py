@@ -0,0 +1,262 @@
+import fcntl
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from flask import Blueprint, request, jsonify, current_app, abort
+from flask_jwt_extended import jwt_required, get_jwt_identity
+
+from extensions import db, publish_event
+from models import User, Product, ProductRecommendation
+
+catalog_bp = Blueprint('catalog', __name__)
+
+# Per-process LRU cache of serialized product lists keyed by the normalised
+# list arguments and capped at CATALOG_CACHE_SIZE entries. Mutations clear it
+# in the worker that handled them; other workers catch up within
+# CATALOG_CACHE_TTL seconds. Unused when the catalog snapshot is on.
+_product_list_cache = OrderedDict()
+_product_list_cache_lock = threading.Lock()
+# (loaded_at, frozenset of categories), so unknown ?category= values never
+# reach the cache; refreshed on the same TTL and cleared with it
+_known_categories = None
+
+PRODUCT_SORTS = {
+    'price_asc': (Product.price.asc(), Product.id.asc()),
+    'price_desc': (Product.price.desc(), Product.id.desc()),
+}
+
+
+def load_product_list(featured=False, limit=None, category=None, sort=None):
+    query = Product.query
+    if featured:
+        query = query.filter_by(featured=True)
+    if category is not None:
+        query = query.filter_by(category=category)
+    if sort in PRODUCT_SORTS:
+        query = query.order_by(*PRODUCT_SORTS[sort])
+    if limit:
+        query = query.limit(limit)
+
+    return [{
+        'id': p.id, 'name': p.name, 'description': p.description,
+        'price': p.price, 'category': p.category, 'image': p.image,
+        'stock': p.stock, 'featured': p.featured
+    } for p in query.all()]
+
+
+def cached_product_list(featured=False, limit=None, category=None, sort=None):
+    key = (featured, limit, category, sort)
+    with _product_list_cache_lock:
+        cached = _product_list_cache.get(key)
+        if cached and time.monotonic() - cached[0] < current_app.config['CATALOG_CACHE_TTL']:
+            _product_list_cache.move_to_end(key)
+            return cached[1]
+
+    products = load_product_list(featured, limit, category, sort)
+    with _product_list_cache_lock:
+        _product_list_cache[key] = (time.monotonic(), products)
+        _product_list_cache.move_to_end(key)
+        while len(_product_list_cache) > current_app.config['CATALOG_CACHE_SIZE']:
+            _product_list_cache.popitem(last=False)
+    return products
+
+
+def known_categories():
+    global _known_categories
+    cached = _known_categories
+    if cached and time.monotonic() - cached[0] < current_app.config['CATALOG_CACHE_TTL']:
+        return cached[1]
+
+    categories = frozenset(c for (c,) in db.session.query(Product.category).distinct())
+    _known_categories = (time.monotonic(), categories)
+    return categories
+
+
+def catalog_snapshot_path():
+    return current_app.config['CATALOG_SNAPSHOT_PATH'] or \
+        os.path.join(current_app.instance_path, 'catalog.snapshot')
+
+
+def get_catalog_snapshot():
+    """Return the shared catalog snapshot, or None when disabled or not built yet."""
+    if not current_app.config['CATALOG_SNAPSHOT']:
+        return None
+    reader = current_app.extensions.get('catalog_snapshot')
+    if reader is None:
+        from catalog_snapshot import SnapshotReader
+
+        reader = current_app.extensions.setdefault('catalog_snapshot', SnapshotReader(
+            catalog_snapshot_path(), current_app.config['CATALOG_SNAPSHOT_CHECK_SECONDS']))
+    return reader.current()
+
+
+def build_catalog_snapshot():
+    """Write a fresh snapshot from the DB; every worker picks it up on its next check."""
+    from catalog_snapshot import write_snapshot
+
+    path = catalog_snapshot_path()
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    # Rebuilds from concurrent edits take turns and only read the DB once they
+    # hold the lock, so an older read can never be renamed over a newer one
+    with open(f'{path}.lock', 'a') as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        # Start a fresh transaction so the read sees every commit made so far
+        db.session.commit()
+        write_snapshot(path, load_product_list())
+    reader = current_app.extensions.get('catalog_snapshot')
+    if reader is not None:
+        reader.invalidate()
+
+
+def invalidate_catalog_cache():
+    global _known_categories
+    with _product_list_cache_lock:
+        _product_list_cache.clear()
+        _known_categories = None
+    if current_app.config['CATALOG_SNAPSHOT']:
+        build_catalog_snapshot()
+
+
+def warm_catalog_cache():
+    """Fill the lists the storefront asks for on first paint."""
+    if current_app.config['CATALOG_SNAPSHOT']:
+        if get_catalog_snapshot() is None:
+            build_catalog_snapshot()
+        return
+    cached_product_list()
+    cached_product_list(featured=True, limit=10)
+
+
+@catalog_bp.route('/api/products', methods=['GET'])
+def get_products():
+    featured = request.args.get('featured') == 'true'
+    # Normalise the arguments so equivalent requests share one cache entry
+    limit = request.args.get('limit', type=int)
+    if limit is not None and limit <= 0:
+        limit = None
+    category = request.args.get('category')
+    sort = request.args.get('sort')
+    if sort not in PRODUCT_SORTS:
+        sort = None
+
+    snapshot = get_catalog_snapshot()
+    if snapshot is not None:
+        return jsonify(snapshot.list(featured, limit, category, sort))
+    if category is not None and category not in known_categories():
+        return jsonify([])
+    return jsonify(cached_product_list(featured, limit, category, sort))
+
+@catalog_bp.route('/api/products/<int:product_id>', methods=['GET'])
+def get_product(product_id):
+    snapshot = get_catalog_snapshot()
+    if snapshot is not None:
+        product = snapshot.get(product_id)
+        if product is None:
+            abort(404)
+        return jsonify(product)
+
+    product = Product.query.get_or_404(product_id)
+    return jsonify({
+        'id': product.id, 'name': product.name, 'description': product.description,
+        'price': product.price, 'category': product.category, 'image': product.image,
+        'stock': product.stock, 'featured': product.featured
+    })
+@catalog_bp.route('/api/products/<int:product_id>/related', methods=['GET'])
+def get_related_products(product_id):
+    limit = max(1, min(request.args.get('limit', 4, type=int), current_app.config['RECOMMENDATIONS_TOP_K']))
+
+    rows = db.session.query(Product) \
+        .join(ProductRecommendation, ProductRecommendation.related_product_id == Product.id) \
+        .filter(ProductRecommendation.product_id == product_id) \
+        .order_by(ProductRecommendation.rank) \
+        .limit(limit) \
+        .all()
+
+    return jsonify([{
+        'id': p.id, 'name': p.name, 'price': p.price,
+        'category': p.category, 'image': p.image, 'stock': p.stock
+    } for p in rows])
+
+@catalog_bp.route('/api/products', methods=['POST'])
+@jwt_required()
+def create_product():
+    user_id = get_jwt_identity()
+    user = User.query.get(user_id)
+    
+    if user.role != 'admin':
+        return jsonify({'message': 'Admin access required'}), 403
+    
+    data = request.get_json()
+    print("Received data:", data)  # LOG DATA
+    
+    if not data:
+        return jsonify({'message': 'No input data provided'}), 400
+
+    required_fields = ['name', 'price', 'category', 'stock']
+    for field in required_fields:
+        if field not in data or data[field] in [None, '']:
+            return jsonify({'message': f'{field} is required'}), 422
+
+    product = Product(
+        name=data['name'],
+        description=data.get('description', ''),
+        price=float(data['price']),
+        category=data['category'],
+        image=data.get('image', ''),
+        stock=int(data['stock']),
+        featured=data.get('featured', False)
+    )
+    db.session.add(product)
+    db.session.commit()
+    invalidate_catalog_cache()
+    publish_event({'type': 'stock', 'productId': product.id, 'stock': product.stock})
+    
+    return jsonify({'message': 'Product created successfully'}), 201
+
+
+
+
+@catalog_bp.route('/api/products/<int:product_id>', methods=['PUT'])
+@jwt_required()
+def update_product(product_id):
+    user_id = get_jwt_identity()
+    user = User.query.get(user_id)
+    
+    if user.role != 'admin':
+        return jsonify({'message': 'Admin access required'}), 403
+    
+    product = Product.query.get_or_404(product_id)
+    data = request.get_json()
+    
+    product.name = data['name']
+    product.description = data['description']
+    product.price = float(data['price'])
+    product.category = data['category']
+    product.image = data.get('image')
+    stock_changed = product.stock != int(data['stock'])
+    product.stock = int(data['stock'])
+    product.featured = data.get('featured', False)
+    
+    db.session.commit()
+    invalidate_catalog_cache()
+    if stock_changed:
+        publish_event({'type': 'stock', 'productId': product.id, 'stock': product.stock})
+    return jsonify({'message': 'Product updated successfully'})
+
+@catalog_bp.route('/api/products/<int:product_id>', methods=['DELETE'])
+@jwt_required()
+def delete_product(product_id):
+    user_id = get_jwt_identity()
+    user = User.query.get(user_id)
+    
+    if user.role != 'admin':
+        return jsonify({'message': 'Admin access required'}), 403
+    
+    product = Product.query.get_or_404(product_id)
+    db.session.delete(product)
+    db.session.commit()
+    invalidate_catalog_cache()
+    
+    return jsonify({'message': 'Product deleted successfully'})
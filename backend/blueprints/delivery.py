@@ -0,0 +1,90 @@
+from flask import Blueprint, request, jsonify
+from flask_jwt_extended import jwt_required, get_jwt_identity
+
+from extensions import db
+from models import User, DeliveryZone
+
+delivery_bp = Blueprint('delivery', __name__)
+
+
+@delivery_bp.route('/api/check-delivery/<pincode>', methods=['GET'])
+def check_delivery_get(pincode):
+    zone = DeliveryZone.query.filter_by(pincode=pincode).first()
+    if zone:
+        return jsonify({'deliverable': True, 'city': zone.city, 'state': zone.state})
+    return jsonify({'deliverable': False})
+
+
+@delivery_bp.route('/api/check-delivery', methods=['POST'])
+def check_delivery_post():
+    data = request.get_json()
+    pincode = str(data.get('pincode')).strip()
+    state = str(data.get('state')).strip().lower()
+
+    zone = DeliveryZone.query.filter_by(pincode=pincode).first()
+
+    if zone and zone.state.lower().strip() == state:
+        return jsonify({'deliverable': True})
+
+    return jsonify({'deliverable': False})
+
+
+# Get all zones
+@delivery_bp.route('/api/admin/delivery-zones', methods=['GET'])
+@jwt_required()
+def get_delivery_zones():
+    identity = get_jwt_identity()
+    user = User.query.get(identity)
+    if user.role != 'admin':
+        return jsonify({'msg': 'Access denied'}), 403
+
+    zones = DeliveryZone.query.all()
+    return jsonify([{
+        'id': z.id,
+        'city': z.city,
+        'state': z.state,
+        'pincode': z.pincode
+    } for z in zones])
+
+
+# Add a new zone
+@delivery_bp.route('/api/admin/delivery-zones', methods=['POST'])
+@jwt_required()
+def add_delivery_zone():
+    identity = get_jwt_identity()
+    user = User.query.get(identity)
+    if user.role != 'admin':
+        return jsonify({'msg': 'Access denied'}), 403
+
+    data = request.get_json()
+    city = data.get('city')
+    state = data.get('state')
+    pincode = data.get('pincode')
+
+    if not city or not state or not pincode:
+        return jsonify({'msg': 'All fields required'}), 400
+
+    zone = DeliveryZone(city=city, state=state, pincode=pincode)
+    db.session.add(zone)
+    db.session.commit()
+
+    return jsonify({'msg': 'Delivery zone added successfully!'})
+
+
+
+# Delete a zone
+@delivery_bp.route('/api/admin/delivery-zones/<int:zone_id>', methods=['DELETE'])
+@jwt_required()
+def delete_delivery_zone(zone_id):
+    identity = get_jwt_identity()
+    user = User.query.get(identity)
+    if user.role != 'admin':
+        return jsonify({'msg': 'Access denied'}), 403
+
+    zone = DeliveryZone.query.get(zone_id)
+    if not zone:
+        return jsonify({'msg': 'Zone not found'}), 404
+
+    db.session.delete(zone)
+    db.session.commit()
+    return jsonify({'msg': 'Delivery zone deleted successfully'})
@@ -0,0 +1,127 @@
+import json
+import time
+
+from flask import Blueprint, Response, request, jsonify, current_app
+from flask_jwt_extended import jwt_required, get_jwt
+from itsdangerous import BadSignature, URLSafeTimedSerializer
+
+from extensions import db, get_event_broker
+from models import User
+from revocation import is_token_revoked
+
+events_bp = Blueprint('events', __name__)
+
+
+def parse_product_ids(value):
+    if not value:
+        return None
+    try:
+        return {int(product_id) for product_id in value.split(',') if product_id}
+    except ValueError:
+        return False
+
+
+def build_filter(product_ids, order_user_id, is_admin):
+    """Return the predicate deciding which events a subscriber receives.
+
+    Stock events are limited to `product_ids` (None means every product).
+    Order events only go to subscribers that asked for them: their own
+    orders, or every order for admins.
+    """
+    def matches(event):
+        if event['type'] == 'stock':
+            return product_ids is None or event['productId'] in product_ids
+        if event['type'] == 'order_status':
+            return is_admin or (order_user_id is not None and event['userId'] == order_user_id)
+        return False
+    return matches
+
+
+def format_event(event):
+    return f"event: {event['type']}\ndata: {json.dumps(event)}\n\n"
+
+
+def ticket_serializer():
+    # Its own salt, so a ticket can never pass for an access token or vice versa
+    return URLSafeTimedSerializer(current_app.config['JWT_SECRET_KEY'], salt='events-ticket')
+
+
+def token_still_valid(claims):
+    """Re-check an open stream's access token: expiry, revocation and role."""
+    if time.time() >= claims['exp'] or is_token_revoked({}, claims):
+        return False
+    user = db.session.get(User, int(claims['sub']))
+    return user is not None and (user.role == 'admin') == claims['admin']
+
+
+# EventSource can't send headers, and a JWT in ?token= would end up in access
+# logs, so order streams open with a ticket from here that expires within
+# EVENTS_TICKET_SECONDS. It carries the access token's claims for re-checks.
+@events_bp.route('/api/events/ticket', methods=['POST'])
+@jwt_required()
+def create_ticket():
+    claims = get_jwt()
+    user = db.session.get(User, int(claims['sub']))
+    if not user:
+        return jsonify({'message': 'User not found'}), 404
+    ticket = ticket_serializer().dumps({
+        'sub': claims['sub'], 'jti': claims['jti'], 'iat': claims['iat'],
+        'exp': claims['exp'], 'admin': user.role == 'admin'
+    })
+    return jsonify({'ticket': ticket, 'expiresIn': current_app.config['EVENTS_TICKET_SECONDS']})
+
+
+# Each open stream holds its connection for as long as the client stays; run
+# this route on gevent workers (see gunicorn.conf.py) so idle streams cost a greenlet.
+@events_bp.route('/api/events', methods=['GET'])
+def stream_events():
+    product_ids = parse_product_ids(request.args.get('products'))
+    if product_ids is False:
+        return jsonify({'message': 'products must be a comma-separated list of ids'}), 400
+
+    claims = None
+    order_user_id = None
+    is_admin = False
+    if request.args.get('orders') == 'true':
+        ticket = request.args.get('ticket')
+        if not ticket:
+            return jsonify({'message': 'ticket is required for order events'}), 401
+        try:
+            claims = ticket_serializer().loads(ticket, max_age=current_app.config['EVENTS_TICKET_SECONDS'])
+        except BadSignature:
+            return jsonify({'message': 'Invalid or expired ticket'}), 401
+        if not token_still_valid(claims):
+            return jsonify({'message': 'Token has been revoked'}), 401
+        order_user_id = int(claims['sub'])
+        is_admin = claims['admin']
+        if product_ids is None:
+            product_ids = set()
+        # Don't hold a pooled DB connection for the lifetime of the stream
+        db.session.remove()
+
+    app = current_app._get_current_object()
+    subscription = get_event_broker().subscribe(build_filter(product_ids, order_user_id, is_admin))
+    heartbeat = app.config['EVENTS_HEARTBEAT_SECONDS']
+
+    def stream():
+        check_at = time.monotonic() + heartbeat
+        try:
+            yield 'retry: 3000\n\n'
+            while True:
+                if claims is not None and time.monotonic() >= check_at:
+                    # A token revoked, expired or demoted since the stream opened
+                    # ends it; the client then needs a fresh ticket
+                    with app.app_context():
+                        if not token_still_valid(claims):
+                            return
+                    check_at = time.monotonic() + heartbeat
+                event = subscription.get(timeout=heartbeat)
+                # Heartbeats keep proxies from closing idle streams and surface disconnects
+                yield format_event(event) if event else ': keep-alive\n\n'
+        finally:
+            subscription.close()
+
+    return Response(stream(), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no'
+    })
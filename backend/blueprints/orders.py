@@ -0,0 +1,208 @@
+from flask import Blueprint, request, jsonify, current_app
+from flask_jwt_extended import jwt_required, get_jwt_identity
+import hmac
+import hashlib
+
+from extensions import db, get_razorpay_client, publish_event
+from models import (Order, Address, add_order_items, get_items_for_orders,
+                    find_order, user_order_rows)
+
+orders_bp = Blueprint('orders', __name__)
+
+
+@orders_bp.route('/api/orders', methods=['POST'])
+@jwt_required()
+def create_order():
+    try:
+        user_id = get_jwt_identity()
+        data = request.get_json()
+
+        if not data or 'totalAmount' not in data or 'items' not in data:
+            return jsonify({'message': 'Invalid request data'}), 400
+
+        # Create Razorpay order
+        razorpay_order = get_razorpay_client().order.create({
+            'amount': int(float(data['totalAmount']) * 100),  # amount in paise
+            'currency': 'INR',
+            'payment_capture': 1
+        })
+
+        # Create order in DB
+        order = Order(
+            user_id=user_id,
+            total_amount=float(data['totalAmount']),
+            razorpay_order_id=razorpay_order['id'],
+            shipping_address=data.get('shippingAddress', '')
+        )
+        db.session.add(order)
+        db.session.flush()  # To get order.id before commit
+
+        # Add order items
+        add_order_items(order, data['items'])
+
+        db.session.commit()
+
+        return jsonify({
+            'orderId': order.id,
+            'razorpayOrderId': razorpay_order['id']
+        })
+
+    except Exception as e:
+        return jsonify({'message': 'Order creation failed', 'error': str(e)}), 500
+    
+
+@orders_bp.route('/api/create-razorpay-order', methods=['POST'])
+@jwt_required()
+def create_razorpay_order():
+    try:
+        data = request.get_json()
+        if not data or 'totalAmount' not in data:
+            return jsonify({'message': 'Invalid request data'}), 400
+
+        razorpay_order = get_razorpay_client().order.create({
+            'amount': int(float(data['totalAmount']) * 100),  # amount in paise
+            'currency': 'INR',
+            'payment_capture': 1
+        })
+
+        return jsonify({
+            'razorpayOrderId': razorpay_order['id']
+        })
+
+    except Exception as e:
+        return jsonify({'message': 'Razorpay order creation failed', 'error': str(e)}), 500
+
+
+# ---------------- Verify Payment ----------------
+@orders_bp.route('/api/orders/verify-payment', methods=['POST'])
+@jwt_required()
+def verify_payment():
+    try:
+        user_id = get_jwt_identity()
+        data = request.get_json()
+        required_fields = ['razorpayOrderId', 'razorpayPaymentId', 'razorpaySignature', 'items', 'totalAmount', 'shippingAddress']
+        if not all(field in data for field in required_fields):
+            return jsonify({'message': 'Missing required fields'}), 400
+
+        # Verify signature
+        secret = current_app.config["RAZORPAY_KEY_SECRET"]
+        generated_signature = hmac.new(
+            secret.encode(),
+            f"{data['razorpayOrderId']}|{data['razorpayPaymentId']}".encode(),
+            hashlib.sha256
+        ).hexdigest()
+
+        if generated_signature != data['razorpaySignature']:
+            return jsonify({'message': 'Payment verification failed'}), 400
+
+        # ✅ Now create order in DB
+        order = Order(
+            user_id=user_id,
+            total_amount=float(data['totalAmount']),
+            razorpay_order_id=data['razorpayOrderId'],
+            razorpay_payment_id=data['razorpayPaymentId'],
+            shipping_address=data['shippingAddress'],
+            status="processing"
+        )
+        db.session.add(order)
+        db.session.flush()  # get order.id
+
+        # Add items
+        add_order_items(order, data['items'])
+
+        db.session.commit()
+        publish_event({'type': 'order_status', 'orderId': order.id,
+                       'userId': order.user_id, 'status': order.status})
+
+        return jsonify({'message': 'Payment verified and order created', 'orderId': order.id})
+
+    except Exception as e:
+        return jsonify({'message': 'Payment verification failed', 'error': str(e)}), 500
+
+# ---------------- Get User Orders ----------------
+@orders_bp.route('/api/orders/user', methods=['GET'])
+@jwt_required()
+def get_user_orders():
+    try:
+        user_id = get_jwt_identity()
+        orders = user_order_rows(int(user_id))
+        return jsonify([{
+            'id': o.id,
+            'totalAmount': o.total_amount,
+            'status': o.status,
+            'createdAt': o.created_at.isoformat()
+        } for o in orders])
+    except Exception as e:
+        return jsonify({'message': 'Failed to fetch orders', 'error': str(e)}), 500
+
+
+# ---------------- Order History (paginated) ----------------
+@orders_bp.route('/api/orders/history', methods=['GET'])
+@jwt_required()
+def get_order_history():
+    user_id = int(get_jwt_identity())
+    page = max(request.args.get('page', 1, type=int), 1)
+    per_page = min(max(request.args.get('per_page', 10, type=int), 1), 50)
+    expand_items = request.args.get('expand') == 'items'
+
+    # Fetch one extra row to know whether another page exists without a COUNT(*)
+    orders = user_order_rows(user_id, limit=per_page + 1, offset=(page - 1) * per_page)
+    has_more = len(orders) > per_page
+    orders = orders[:per_page]
+
+    items_by_order = {}
+    if expand_items:
+        items_by_order.update(get_items_for_orders([o.id for o in orders if not o.archived]))
+        items_by_order.update(get_items_for_orders([o.id for o in orders if o.archived], archived=True))
+
+    result = []
+    for o in orders:
+        entry = {
+            'id': o.id,
+            'totalAmount': o.total_amount,
+            'status': o.status,
+            'createdAt': o.created_at.isoformat()
+        }
+        if expand_items:
+            entry['items'] = items_by_order[o.id]
+        result.append(entry)
+
+    return jsonify({
+        'orders': result,
+        'page': page,
+        'perPage': per_page,
+        'hasMore': has_more
+    })
+
+
+@orders_bp.route('/api/orders/<int:order_id>', methods=['GET'])
+@jwt_required()
+def get_user_order(order_id):
+    user_id = int(get_jwt_identity())
+    order = find_order(order_id)
+
+    # Same response for missing and foreign orders so ids can't be probed
+    if not order or order.user_id != user_id:
+        return jsonify({'message': 'Order not found'}), 404
+
+    return jsonify({
+        'id': order.id,
+        'shippingAddress': order.shipping_address,
+        'items': get_items_for_orders([order.id], archived=order.archived)[order.id],
+        'totalAmount': order.total_amount,
+        'status': order.status,
+        'razorpayPaymentId': order.razorpay_payment_id,
+        'createdAt': order.created_at.isoformat()
+    })
+
+
+@orders_bp.route('/api/addresses', methods=['GET'])
+@jwt_required()
+def get_addresses():
+    user_id = get_jwt_identity()
+    addresses = Address.query.filter_by(user_id=user_id).all()
+    
+    return jsonify([{
+        'id': a.id, 'label': a.label, 'address': a.address,
+        'city': a.city, 'state': a.state, 'zipCode': a.zip_code
+    } for a in addresses])
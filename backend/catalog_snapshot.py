@@ -0,0 +1,197 @@
+"""Read-only, memory-mapped catalog snapshot shared by all workers.
+
+The snapshot is one file of column arrays: numeric product fields, string
+fields packed into a UTF-8 blob with offsets and a null mask, a per-category
+row index and price-sorted orderings (overall and within each category).
+Workers mmap it, so the pages live once in the OS page cache however many
+workers there are. A new snapshot is written next to the old one and renamed
+over it; readers notice the new inode and remap.
+"""
+import json
+import logging
+import mmap
+import os
+import tempfile
+import threading
+import time
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b'SHOPCAT2'
+ALIGN = 64
+STRING_FIELDS = ('name', 'description', 'image')
+
+
+def _pack_strings(values):
+    values = list(values)
+    encoded = [(v or '').encode() for v in values]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum([len(b) for b in encoded])
+    nulls = np.array([v is None for v in values], dtype=np.bool_)
+    return np.frombuffer(b''.join(encoded), dtype=np.uint8), offsets, nulls
+
+
+def write_snapshot(path, products):
+    """Write `products` (dicts with Product columns) atomically to `path`."""
+    products = sorted(products, key=lambda p: p['id'])
+
+    categories = sorted({p['category'] for p in products})
+    category_codes = {c: i for i, c in enumerate(categories)}
+
+    arrays = {
+        'id': np.array([p['id'] for p in products], dtype=np.int64),
+        'price': np.array([p['price'] for p in products], dtype=np.float64),
+        'stock': np.array([p['stock'] or 0 for p in products], dtype=np.int64),
+        'featured': np.array([bool(p['featured']) for p in products], dtype=np.bool_),
+        'category': np.array([category_codes[p['category']] for p in products], dtype=np.int32),
+    }
+    for field in STRING_FIELDS:
+        arrays[f'{field}_blob'], arrays[f'{field}_offsets'], arrays[f'{field}_null'] = \
+            _pack_strings(p[field] for p in products)
+
+    # Rows grouped by category (each group in id order), CSR-style
+    by_category = np.argsort(arrays['category'], kind='stable')
+    arrays['category_rows'] = by_category.astype(np.int64)
+    arrays['category_offsets'] = np.searchsorted(
+        arrays['category'][by_category], np.arange(len(categories) + 1)).astype(np.int64)
+    arrays['price_order'] = np.argsort(arrays['price'], kind='stable').astype(np.int64)
+    # Rows grouped by category and price-sorted within each group (ties in id
+    # order); shares category_offsets, so a category+sort listing is a slice
+    arrays['category_price_rows'] = np.lexsort((arrays['price'], arrays['category'])).astype(np.int64)
+
+    header = {'count': len(products), 'categories': categories, 'arrays': {}}
+    offset = 0
+    for name, array in arrays.items():
+        header['arrays'][name] = [array.dtype.str, offset, int(array.size)]
+        offset += -(-array.nbytes // ALIGN) * ALIGN
+    header_bytes = json.dumps(header).encode()
+    data_start = -(-(len(MAGIC) + 8 + len(header_bytes)) // ALIGN) * ALIGN
+
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), prefix='.catalog-')
+    with os.fdopen(fd, 'wb') as f:
+        f.write(MAGIC)
+        f.write(len(header_bytes).to_bytes(8, 'little'))
+        f.write(header_bytes)
+        for name, array in arrays.items():
+            f.seek(data_start + header['arrays'][name][1])
+            f.write(array.tobytes())
+        f.truncate(data_start + offset)
+        f.flush()
+        os.fsync(f.fileno())
+        # mkstemp creates 0600; workers may run as a different user than the CLI
+        os.fchmod(f.fileno(), 0o644)
+    os.replace(tmp_path, path)
+
+
+class CatalogSnapshot:
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            self.inode = os.fstat(f.fileno()).st_ino
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if self._mmap[:len(MAGIC)] != MAGIC:
+            raise ValueError(f'{path} is not a catalog snapshot')
+        header_len = int.from_bytes(self._mmap[len(MAGIC):len(MAGIC) + 8], 'little')
+        header = json.loads(self._mmap[len(MAGIC) + 8:len(MAGIC) + 8 + header_len])
+        data_start = -(-(len(MAGIC) + 8 + header_len) // ALIGN) * ALIGN
+
+        self.categories = header['categories']
+        self._category_codes = {c: i for i, c in enumerate(self.categories)}
+        # Zero-copy views straight onto the mapped pages
+        self._arrays = {
+            name: np.frombuffer(self._mmap, dtype=np.dtype(dtype), count=count, offset=data_start + offset)
+            for name, (dtype, offset, count) in header['arrays'].items()
+        }
+
+    def __len__(self):
+        return self._arrays['id'].size
+
+    def _string(self, field, row):
+        if self._arrays[f'{field}_null'][row]:
+            return None
+        offsets = self._arrays[f'{field}_offsets']
+        return self._arrays[f'{field}_blob'][offsets[row]:offsets[row + 1]].tobytes().decode()
+
+    def _row_dict(self, row):
+        a = self._arrays
+        return {
+            'id': int(a['id'][row]), 'name': self._string('name', row),
+            'description': self._string('description', row),
+            'price': float(a['price'][row]), 'category': self.categories[a['category'][row]],
+            'image': self._string('image', row),
+            'stock': int(a['stock'][row]), 'featured': bool(a['featured'][row])
+        }
+
+    def get(self, product_id):
+        """Return one product dict, or None."""
+        ids = self._arrays['id']
+        row = int(np.searchsorted(ids, product_id))
+        if row < ids.size and ids[row] == product_id:
+            return self._row_dict(row)
+        return None
+
+    def list(self, featured=False, limit=None, category=None, sort=None):
+        """Return product dicts, in id order unless `sort` is price_asc/price_desc."""
+        a = self._arrays
+        by_price = sort in ('price_asc', 'price_desc')
+        if category is not None:
+            code = self._category_codes.get(category)
+            if code is None:
+                return []
+            start, end = a['category_offsets'][code], a['category_offsets'][code + 1]
+            rows = (a['category_price_rows'] if by_price else a['category_rows'])[start:end]
+        elif by_price:
+            rows = a['price_order']
+        else:
+            rows = np.arange(len(self))
+        if sort == 'price_desc':
+            rows = rows[::-1]
+        if featured:
+            rows = rows[a['featured'][rows]]
+        if limit:
+            rows = rows[:limit]
+
+        return [self._row_dict(row) for row in rows]
+
+
+class SnapshotReader:
+    """Hands out the current snapshot, remapping when the file is replaced."""
+
+    def __init__(self, path, check_interval=1.0):
+        self.path = path
+        self.check_interval = check_interval
+        self._snapshot = None
+        self._rejected_inode = None
+        self._checked_at = 0
+        self._lock = threading.Lock()
+
+    def current(self):
+        """Return the latest CatalogSnapshot, or None if none has been built."""
+        now = time.monotonic()
+        if now - self._checked_at < self.check_interval:
+            return self._snapshot
+
+        with self._lock:
+            self._checked_at = now
+            try:
+                inode = os.stat(self.path).st_ino
+            except FileNotFoundError:
+                self._snapshot = None
+                return None
+            if self._snapshot is None or self._snapshot.inode != inode:
+                if inode == self._rejected_inode:
+                    return None
+                try:
+                    # The old map is released once no request still holds it
+                    self._snapshot = CatalogSnapshot(self.path)
+                except ValueError:
+                    # e.g. written by an older release; serve from the DB until rebuilt
+                    logger.warning('Ignoring unreadable catalog snapshot %s', self.path, exc_info=True)
+                    self._snapshot, self._rejected_inode = None, inode
+            return self._snapshot
+
+    def invalidate(self):
+        """Force the next current() call to look at the file again."""
+        self._checked_at = 0
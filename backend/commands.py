@@ -0,0 +1,250 @@
+from flask import current_app
+from flask.cli import AppGroup
+from werkzeug.security import generate_password_hash
+from datetime import datetime, timedelta
+import os
+import time
+import click
+
+from extensions import db
+from models import (User, Product, Order, OrderItem, ArchivedOrder, ArchivedOrderItem,
+                    OrderArchiveSummary, ProductRecommendation)
+
+
+# Create admin user
+def create_admin():
+    admin = User.query.filter_by(email='admin@shopease.com').first()
+    if not admin:
+        admin = User(
+            name='Admin',
+            email='admin@shopease.com',
+            password_hash=generate_password_hash('admin123'),
+            role='admin'
+        )
+        db.session.add(admin)
+        db.session.commit()
+
+
+@click.command('create-admin')
+def create_admin_command():
+    """Create the default admin user if it doesn't exist."""
+    create_admin()
+    click.echo('Admin user ready')
+
+
+# Recommendations
+# NumPy/SciPy are imported inside these functions so web workers never load them.
+def paid_line_items(after_order_id=0, chunk_size=50000):
+    """Return (order_ids, product_ids) arrays for paid orders newer than `after_order_id`.
+
+    Rows are streamed from the DB in chunks and packed straight into int64
+    arrays, so memory stays near 16 bytes per line item instead of a Python
+    tuple per row.
+    """
+    import itertools
+    import numpy as np
+
+    chunks = []
+    for order_model, item_model in ((Order, OrderItem), (ArchivedOrder, ArchivedOrderItem)):
+        query = db.select(item_model.order_id, item_model.product_id) \
+            .join(order_model, item_model.order_id == order_model.id) \
+            .where(order_model.id > after_order_id,
+                   order_model.razorpay_payment_id.isnot(None),
+                   order_model.status != 'cancelled') \
+            .execution_options(yield_per=chunk_size)
+        for partition in db.session.execute(query).partitions():
+            chunks.append(np.fromiter(itertools.chain.from_iterable(partition),
+                                      dtype=np.int64, count=2 * len(partition)))
+    if not chunks:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    pairs = np.concatenate(chunks).reshape(-1, 2)
+    return pairs[:, 0], pairs[:, 1]
+
+
+def update_recommendations(full=False):
+    """Fold newly paid orders into the co-occurrence matrix and refresh neighbours.
+
+    Incremental runs only rescore products touched by the new orders and their
+    neighbours. Orders cancelled after being counted stay counted until the
+    next full rebuild.
+
+    Order ids are allocated before commit, so an order can become visible
+    after a run has already moved past its id. Each run therefore re-reads the
+    last RECOMMENDATIONS_ORDER_WINDOW ids and skips orders already counted there.
+    """
+    import numpy as np
+    import recommendations
+
+    path = current_app.config['RECOMMENDATIONS_STATE_PATH'] or \
+        os.path.join(current_app.instance_path, 'recommendations.npz')
+    window = current_app.config['RECOMMENDATIONS_ORDER_WINDOW']
+    state = None if full else recommendations.load_state(path)
+    cooccurrence, order_count, last_order_id, counted = \
+        state or (None, 0, 0, np.empty(0, dtype=np.int64))
+
+    order_ids, product_ids = paid_line_items(max(last_order_id - window, 0))
+    new_lines = ~np.isin(order_ids, counted)
+    order_ids, product_ids = order_ids[new_lines], product_ids[new_lines]
+    if state and order_ids.size == 0:
+        return 0
+
+    n_products = max(int(db.session.query(db.func.max(Product.id)).scalar() or 0),
+                     int(product_ids.max(initial=0))) + 1
+    delta, delta_orders = recommendations.build_cooccurrence(order_ids, product_ids, n_products)
+
+    if state:
+        cooccurrence = recommendations.resize(cooccurrence, n_products) + delta
+        touched = np.unique(product_ids)
+        rows = np.union1d(touched, cooccurrence[touched].indices)
+    else:
+        cooccurrence, rows = delta, None
+    order_count += delta_orders
+
+    recs = []
+    rescored = []
+    for product_id, neighbours in recommendations.top_k(
+            cooccurrence, order_count,
+            k=current_app.config['RECOMMENDATIONS_TOP_K'],
+            scorer=current_app.config['RECOMMENDATIONS_SCORER'],
+            rows=rows):
+        rescored.append(product_id)
+        recs.extend({
+            'product_id': product_id, 'rank': rank,
+            'related_product_id': related_id, 'score': score
+        } for rank, (related_id, score) in enumerate(neighbours))
+
+    if state:
+        ProductRecommendation.query \
+            .filter(ProductRecommendation.product_id.in_(rescored)) \
+            .delete(synchronize_session=False)
+    else:
+        ProductRecommendation.query.delete()
+    if recs:
+        db.session.execute(ProductRecommendation.__table__.insert(), recs)
+    db.session.commit()
+
+    if order_ids.size:
+        last_order_id = max(last_order_id, int(order_ids.max()))
+    counted = np.union1d(counted, order_ids)
+    counted = counted[counted > last_order_id - window]
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    recommendations.save_state(path, cooccurrence, order_count, last_order_id, counted)
+    return len(rescored)
+
+
+recommendations_cli = AppGroup('recommendations', help='Frequently-bought-together engine.')
+
+@recommendations_cli.command('build')
+def build_recommendations_command():
+    """Rebuild all recommendations from order history."""
+    count = update_recommendations(full=True)
+    click.echo(f'Scored {count} products')
+
+@recommendations_cli.command('update')
+@click.option('--interval', type=int, default=0, help='Keep running, polling every N seconds.')
+def update_recommendations_command(interval):
+    """Fold in paid orders placed since the last run."""
+    while True:
+        count = update_recommendations()
+        click.echo(f'Rescored {count} products')
+        if not interval:
+            break
+        db.session.remove()
+        time.sleep(interval)
+
+
+
+# Order archival
+ARCHIVABLE_STATUSES = ('delivered', 'cancelled')
+
+def archive_orders(months=6, batch_size=500):
+    """Move closed orders older than `months` to the archive tables in batches.
+
+    Each batch copies orders and items, bumps the archive summary and deletes
+    the hot rows in one transaction. The newest hot order is never moved so the
+    AUTO_INCREMENT counter can't fall back onto an archived id after a restart.
+
+    Batches page by id, so rows that don't qualify (e.g. abandoned pending
+    orders) are scanned once rather than on every batch, and each batch's
+    orders are locked until it commits so a concurrent status update waits
+    instead of being lost.
+    """
+    cutoff = datetime.utcnow() - timedelta(days=30 * months)
+    max_id = db.session.query(db.func.max(Order.id)).scalar() or 0
+    last_id = 0
+    moved = 0
+
+    while True:
+        orders = Order.query \
+            .filter(Order.status.in_(ARCHIVABLE_STATUSES),
+                    Order.created_at < cutoff,
+                    Order.id > last_id,
+                    Order.id < max_id) \
+            .order_by(Order.id) \
+            .limit(batch_size) \
+            .with_for_update() \
+            .all()
+        if not orders:
+            break
+
+        order_ids = [o.id for o in orders]
+        last_id = order_ids[-1]
+        items = OrderItem.query.filter(OrderItem.order_id.in_(order_ids)).all()
+
+        db.session.execute(ArchivedOrder.__table__.insert(), [{
+            'id': o.id, 'user_id': o.user_id, 'total_amount': o.total_amount,
+            'status': o.status, 'razorpay_order_id': o.razorpay_order_id,
+            'razorpay_payment_id': o.razorpay_payment_id,
+            'shipping_address': o.shipping_address, 'created_at': o.created_at,
+            'archived_at': datetime.utcnow()
+        } for o in orders])
+        if items:
+            db.session.execute(ArchivedOrderItem.__table__.insert(), [{
+                'id': i.id, 'order_id': i.order_id, 'product_id': i.product_id,
+                'quantity': i.quantity, 'price': i.price,
+                'product_name': i.product_name, 'product_image': i.product_image
+            } for i in items])
+
+        summary = OrderArchiveSummary.query.with_for_update().get(1)
+        if not summary:
+            summary = OrderArchiveSummary(id=1, order_count=0, revenue=0)
+            db.session.add(summary)
+        summary.order_count += len(orders)
+        summary.revenue += sum(o.total_amount for o in orders)
+
+        OrderItem.query.filter(OrderItem.order_id.in_(order_ids)).delete(synchronize_session=False)
+        Order.query.filter(Order.id.in_(order_ids)).delete(synchronize_session=False)
+        db.session.commit()
+        db.session.expunge_all()
+        moved += len(orders)
+
+    return moved
+
+
+orders_cli = AppGroup('orders', help='Order maintenance.')
+
+@orders_cli.command('archive')
+@click.option('--months', type=int, default=6, help='Archive closed orders older than this.')
+@click.option('--batch-size', type=int, default=500)
+def archive_orders_command(months, batch_size):
+    """Move delivered/cancelled orders to the archive tables."""
+    moved = archive_orders(months=months, batch_size=batch_size)
+    click.echo(f'Archived {moved} orders')
+
+
+catalog_cli = AppGroup('catalog', help='Catalog maintenance.')
+
+@catalog_cli.command('snapshot')
+def catalog_snapshot_command():
+    """Rebuild the shared memory-mapped catalog snapshot."""
+    from blueprints.catalog import build_catalog_snapshot, catalog_snapshot_path
+
+    build_catalog_snapshot()
+    click.echo(f'Wrote {catalog_snapshot_path()}')
+
+
+def init_app(app):
+    app.cli.add_command(create_admin_command)
+    app.cli.add_command(catalog_cli)
+    app.cli.add_command(recommendations_cli)
+    app.cli.add_command(orders_cli)
@@ -0,0 +1,59 @@
+import os
+from datetime import timedelta
+
+DB_USER = os.environ.get('MYSQL_USER', 'root')        # default root if env not set
+DB_PASSWORD = os.environ.get('MYSQL_PASSWORD', '1947')  # replace with your password
+DB_HOST = os.environ.get('MYSQL_HOST', '0.tcp.in.ngrok.io')
+DB_PORT = os.environ.get('MYSQL_PORT', '16801')       # string is fine; SQLAlchemy converts
+DB_NAME = os.environ.get('MYSQL_DB', 'ecommerce_db')
+
+
+class Config:
+    # PyMySQL is pure Python, so gevent workers (the gunicorn default) can
+    # yield while a query waits; the mysqlclient C driver (mysql://) would
+    # block every greenlet in the worker
+    SQLALCHEMY_DATABASE_URI = os.environ.get(
+        'DATABASE_URL', f"mysql+pymysql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}")
+    JWT_SECRET_KEY = os.environ.get('JWT_SECRET_KEY', 'your-secret-key-change-in-production')
+    JWT_ACCESS_TOKEN_EXPIRES = timedelta(days=7)
+
+    RAZORPAY_KEY_ID = os.environ.get('RAZORPAY_KEY_ID', 'rzp_test_RAe9hgfWZn0DQ5')
+    RAZORPAY_KEY_SECRET = os.environ.get('RAZORPAY_KEY_SECRET', 'IUhKwWY6B846Ul6UnAVPdSin')
+
+    CORS_ORIGINS = [
+        "http://localhost:5173",           # local frontend
+        "https://headphonestore-cmeo.onrender.com"  # deployed frontend
+    ]
+
+    # Defaults to <instance_path>/recommendations.npz when unset
+    RECOMMENDATIONS_STATE_PATH = os.environ.get('RECOMMENDATIONS_STATE_PATH')
+    RECOMMENDATIONS_TOP_K = int(os.environ.get('RECOMMENDATIONS_TOP_K', 10))
+    RECOMMENDATIONS_SCORER = os.environ.get('RECOMMENDATIONS_SCORER', 'lift')
+    # Trailing order-id window re-read each run to catch orders committed late
+    RECOMMENDATIONS_ORDER_WINDOW = int(os.environ.get('RECOMMENDATIONS_ORDER_WINDOW', 1000))
+
+    # Pre-populate read caches in create_app (before gunicorn forks with --preload)
+    WARMUP = os.environ.get('WARMUP', '0') == '1'
+    CATALOG_CACHE_TTL = int(os.environ.get('CATALOG_CACHE_TTL', 30))
+    CATALOG_CACHE_SIZE = int(os.environ.get('CATALOG_CACHE_SIZE', 256))
+
+    # Serve /api/products from a memory-mapped snapshot shared by all workers
+    CATALOG_SNAPSHOT = os.environ.get('CATALOG_SNAPSHOT', '0') == '1'
+    # Defaults to <instance_path>/catalog.snapshot when unset
+    CATALOG_SNAPSHOT_PATH = os.environ.get('CATALOG_SNAPSHOT_PATH')
+    CATALOG_SNAPSHOT_CHECK_SECONDS = float(os.environ.get('CATALOG_SNAPSHOT_CHECK_SECONDS', 1))
+
+    # Live events (/api/events); set to a Redis(-compatible) URL when running several
+    # workers, or fake:// for an in-process fakeredis stand-in
+    EVENTS_REDIS_URL = os.environ.get('EVENTS_REDIS_URL')
+    EVENTS_HEARTBEAT_SECONDS = int(os.environ.get('EVENTS_HEARTBEAT_SECONDS', 15))
+    # Lifetime of the one-off ticket an order stream is opened with
+    EVENTS_TICKET_SECONDS = int(os.environ.get('EVENTS_TICKET_SECONDS', 30))
+
+    # Token revocation: Bloom filter sizing and how often each worker rebuilds it from the DB
+    REVOCATION_BLOOM_CAPACITY = int(os.environ.get('REVOCATION_BLOOM_CAPACITY', 100000))
+    REVOCATION_BLOOM_ERROR_RATE = float(os.environ.get('REVOCATION_BLOOM_ERROR_RATE', 0.001))
+    REVOCATION_REFRESH_SECONDS = int(os.environ.get('REVOCATION_REFRESH_SECONDS', 300))
+    # Append-only log that carries revocations between workers on one host;
+    # defaults to <instance_path>/revocations.log when unset
+    REVOCATION_LOG_PATH = os.environ.get('REVOCATION_LOG_PATH')
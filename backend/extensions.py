@@ -0,0 +1,58 @@
+import threading
+
+from flask import current_app
+from flask_cors import CORS
+from flask_sqlalchemy import SQLAlchemy
+from flask_migrate import Migrate
+from flask_jwt_extended import JWTManager
+
+db = SQLAlchemy()
+migrate = Migrate()
+jwt = JWTManager()
+cors = CORS()
+
+_event_broker_lock = threading.Lock()
+
+
+def get_razorpay_client():
+    """Return the app's Razorpay client, creating it on first use.
+
+    razorpay (and requests under it) is only imported when a payment route
+    actually needs it, keeping it off the worker boot path.
+    """
+    client = current_app.extensions.get('razorpay')
+    if client is None:
+        import razorpay
+        client = razorpay.Client(auth=(current_app.config['RAZORPAY_KEY_ID'],
+                                       current_app.config['RAZORPAY_KEY_SECRET']))
+        current_app.extensions['razorpay'] = client
+    return client
+
+
+def get_event_broker():
+    """Return the app's live-event broker, creating it on first use.
+
+    Uses Redis when EVENTS_REDIS_URL is set (needed once more than one worker
+    process serves the app; `fake://` swaps in fakeredis for development and
+    tests), otherwise an in-process broker.
+    """
+    broker = current_app.extensions.get('event_broker')
+    if broker is None:
+        # Concurrent first subscribers must all end up on the same broker
+        with _event_broker_lock:
+            broker = current_app.extensions.get('event_broker')
+            if broker is None:
+                from pubsub import InProcessBroker, RedisBroker
+
+                url = current_app.config['EVENTS_REDIS_URL']
+                broker = RedisBroker(url) if url else InProcessBroker()
+                current_app.extensions['event_broker'] = broker
+    return broker
+
+
+def publish_event(event):
+    """Publish a live event; delivery problems never fail the request."""
+    try:
+        get_event_broker().publish(event)
+    except Exception:
+        current_app.logger.exception('Failed to publish %s event', event.get('type'))
@@ -0,0 +1,44 @@
+# gunicorn -c gunicorn.conf.py app:app
+import multiprocessing
+import os
+
+from config import Config
+
+# gevent by default: the storefront keeps /api/events streams open, and each
+# idle stream is then a greenlet instead of a whole sync worker that would
+# block (and hit WORKER TIMEOUT). Only set GUNICORN_WORKER_CLASS=sync for a
+# pool that never serves /api/events.
+worker_class = os.environ.get('GUNICORN_WORKER_CLASS', 'gevent')
+worker_connections = int(os.environ.get('GUNICORN_WORKER_CONNECTIONS', 2000))
+
+if worker_class == 'gevent':
+    # Patch before the app is preloaded, or the master imports unpatched modules
+    from gevent import monkey
+    monkey.patch_all()
+
+bind = f"0.0.0.0:{os.environ.get('PORT', 10000)}"
+workers = int(os.environ.get('WEB_CONCURRENCY', multiprocessing.cpu_count() * 2 + 1))
+
+# Import the app (and run create_app's optional WARMUP) once in the master so
+# workers share it copy-on-write instead of each paying the import cost.
+preload_app = os.environ.get('GUNICORN_PRELOAD', '1') == '1'
+
+
+def when_ready(server):
+    if workers > 1 and (Config.EVENTS_REDIS_URL or 'fake://').startswith('fake://'):
+        server.log.warning('%d workers without a shared EVENTS_REDIS_URL: live events published '
+                           'in one worker never reach /api/events clients of the others.', workers)
+    driver = Config.SQLALCHEMY_DATABASE_URI.split('://', 1)[0]
+    if worker_class == 'gevent' and driver in ('mysql', 'mysql+mysqldb'):
+        server.log.warning('%s uses the mysqlclient C driver, which gevent cannot patch: every '
+                           'query blocks all greenlets in its worker. Use mysql+pymysql:// instead.',
+                           driver)
+
+
+def post_fork(server, worker):
+    # Never reuse pooled DB connections inherited from the master
+    from app import app
+    from extensions import db
+
+    with app.app_context():
+        db.engine.dispose(close=False)
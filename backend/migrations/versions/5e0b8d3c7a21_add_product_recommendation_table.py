@@ -0,0 +1,30 @@
+"""Add product recommendation table
+
+Revision ID: 5e0b8d3c7a21
+Revises: c41f7a2e9b10
+Create Date: 2026-10-19 11:40:52.904117
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5e0b8d3c7a21'
+down_revision = 'c41f7a2e9b10'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('product_recommendation',
+    sa.Column('product_id', sa.Integer(), nullable=False),
+    sa.Column('rank', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('related_product_id', sa.Integer(), nullable=False),
+    sa.Column('score', sa.Float(), nullable=False),
+    sa.PrimaryKeyConstraint('product_id', 'rank')
+    )
+
+
+def downgrade():
+    op.drop_table('product_recommendation')
@@ -0,0 +1,26 @@
+"""Index user.sessions_revoked_at
+
+Revision ID: 6f1a0c9d2e47
+Revises: 2b7e9f05c3d4
+Create Date: 2026-10-19 19:31:08.412577
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '6f1a0c9d2e47'
+down_revision = '2b7e9f05c3d4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('user', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_user_sessions_revoked_at'), ['sessions_revoked_at'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('user', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_user_sessions_revoked_at'))
@@ -0,0 +1,68 @@
+"""Add order archive tables
+
+Revision ID: 9d2c61f4e8b7
+Revises: 5e0b8d3c7a21
+Create Date: 2026-10-19 14:05:37.221906
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9d2c61f4e8b7'
+down_revision = '5e0b8d3c7a21'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('order_archive',
+    sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('total_amount', sa.Float(), nullable=False),
+    sa.Column('status', sa.String(length=20), nullable=True),
+    sa.Column('razorpay_order_id', sa.String(length=100), nullable=True),
+    sa.Column('razorpay_payment_id', sa.String(length=100), nullable=True),
+    sa.Column('shipping_address', sa.JSON(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('archived_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['user_id'], ['user.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('order_archive', schema=None) as batch_op:
+        batch_op.create_index('ix_order_archive_user_id_created_at', ['user_id', 'created_at'], unique=False)
+
+    op.create_table('order_item_archive',
+    sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('order_id', sa.Integer(), nullable=False),
+    sa.Column('product_id', sa.Integer(), nullable=False),
+    sa.Column('quantity', sa.Integer(), nullable=False),
+    sa.Column('price', sa.Float(), nullable=False),
+    sa.Column('product_name', sa.String(length=200), nullable=True),
+    sa.Column('product_image', sa.String(length=500), nullable=True),
+    sa.ForeignKeyConstraint(['order_id'], ['order_archive.id'], ),
+    sa.ForeignKeyConstraint(['product_id'], ['product.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('order_item_archive', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_order_item_archive_order_id'), ['order_id'], unique=False)
+
+    op.create_table('order_archive_summary',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('order_count', sa.Integer(), nullable=False),
+    sa.Column('revenue', sa.Float(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+
+
+def downgrade():
+    op.drop_table('order_archive_summary')
+    with op.batch_alter_table('order_item_archive', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_order_item_archive_order_id'))
+
+    op.drop_table('order_item_archive')
+    with op.batch_alter_table('order_archive', schema=None) as batch_op:
+        batch_op.drop_index('ix_order_archive_user_id_created_at')
+
+    op.drop_table('order_archive')
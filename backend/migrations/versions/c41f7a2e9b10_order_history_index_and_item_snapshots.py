@@ -0,0 +1,34 @@
+"""Order history index and order item snapshots
+
+Revision ID: c41f7a2e9b10
+Revises: a3d8969adf86
+Create Date: 2026-10-19 10:12:04.318220
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c41f7a2e9b10'
+down_revision = 'a3d8969adf86'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('order', schema=None) as batch_op:
+        batch_op.create_index('ix_order_user_id_created_at', ['user_id', 'created_at'], unique=False)
+
+    with op.batch_alter_table('order_item', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('product_name', sa.String(length=200), nullable=True))
+        batch_op.add_column(sa.Column('product_image', sa.String(length=500), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table('order_item', schema=None) as batch_op:
+        batch_op.drop_column('product_image')
+        batch_op.drop_column('product_name')
+
+    with op.batch_alter_table('order', schema=None) as batch_op:
+        batch_op.drop_index('ix_order_user_id_created_at')
@@ -0,0 +1,215 @@
+from datetime import datetime
+
+from extensions import db
+
+
+class User(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    name = db.Column(db.String(100), nullable=False)
+    email = db.Column(db.String(120), unique=True, nullable=False)
+    password_hash = db.Column(db.String(255), nullable=False)
+    role = db.Column(db.String(20), default='user')
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    # Tokens issued in earlier seconds are rejected ("log out everywhere");
+    # indexed because every worker's revocation rebuild filters on it
+    sessions_revoked_at = db.Column(db.DateTime, index=True)
+
+class Product(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    name = db.Column(db.String(200), nullable=False)
+    description = db.Column(db.Text)
+    price = db.Column(db.Float, nullable=False)
+    category = db.Column(db.String(50), nullable=False)
+    image = db.Column(db.String(500))
+    stock = db.Column(db.Integer, default=0)
+    featured = db.Column(db.Boolean, default=False)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+class Order(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
+    total_amount = db.Column(db.Float, nullable=False)
+    status = db.Column(db.String(20), default='pending')
+    razorpay_order_id = db.Column(db.String(100))
+    razorpay_payment_id = db.Column(db.String(100))
+    shipping_address = db.Column(db.JSON)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    # Covers the customer order-history listing (filter by user, newest first)
+    __table_args__ = (
+        db.Index('ix_order_user_id_created_at', 'user_id', 'created_at'),
+    )
+
+    archived = False
+
+    def to_dict(self):
+        user = User.query.get(self.user_id)
+        items = get_items_for_orders([self.id], archived=self.archived)[self.id]
+
+        return {
+            'id': self.id,
+            'customer': {
+                'name': user.name if user else None,
+                'email': user.email if user else None
+            },
+            'shippingAddress': self.shipping_address,
+            'items': items,
+            'totalAmount': self.total_amount,
+            'status': self.status,
+            'razorpayOrderId': self.razorpay_order_id,
+            'razorpayPaymentId': self.razorpay_payment_id,
+            'createdAt': self.created_at.isoformat(),
+            'archived': self.archived
+        }
+    
+
+class OrderItem(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    order_id = db.Column(db.Integer, db.ForeignKey('order.id'), nullable=False)
+    product_id = db.Column(db.Integer, db.ForeignKey('product.id'), nullable=False)
+    quantity = db.Column(db.Integer, nullable=False)
+    price = db.Column(db.Float, nullable=False)
+    # Snapshot of the product at purchase time, so history survives catalog edits
+    product_name = db.Column(db.String(200))
+    product_image = db.Column(db.String(500))
+
+# Closed (delivered/cancelled) orders are moved here by `flask orders archive`
+# so the hot tables, and every admin query over them, stay small. Ids are kept.
+class ArchivedOrder(db.Model):
+    __tablename__ = 'order_archive'
+    id = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
+    total_amount = db.Column(db.Float, nullable=False)
+    status = db.Column(db.String(20))
+    razorpay_order_id = db.Column(db.String(100))
+    razorpay_payment_id = db.Column(db.String(100))
+    shipping_address = db.Column(db.JSON)
+    created_at = db.Column(db.DateTime)
+    archived_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    __table_args__ = (
+        db.Index('ix_order_archive_user_id_created_at', 'user_id', 'created_at'),
+    )
+
+    archived = True
+    to_dict = Order.to_dict
+
+class ArchivedOrderItem(db.Model):
+    __tablename__ = 'order_item_archive'
+    id = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    order_id = db.Column(db.Integer, db.ForeignKey('order_archive.id'), nullable=False, index=True)
+    product_id = db.Column(db.Integer, db.ForeignKey('product.id'), nullable=False)
+    quantity = db.Column(db.Integer, nullable=False)
+    price = db.Column(db.Float, nullable=False)
+    product_name = db.Column(db.String(200))
+    product_image = db.Column(db.String(500))
+
+class OrderArchiveSummary(db.Model):
+    # Running totals over the archive, kept in step by the archival job
+    id = db.Column(db.Integer, primary_key=True)
+    order_count = db.Column(db.Integer, nullable=False, default=0)
+    revenue = db.Column(db.Float, nullable=False, default=0)
+
+class RevokedToken(db.Model):
+    # Individually revoked access tokens (logout); rows can go once the token expires
+    jti = db.Column(db.String(36), primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
+    expires_at = db.Column(db.DateTime, nullable=False, index=True)
+    revoked_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+class ProductRecommendation(db.Model):
+    # Precomputed "frequently bought together" neighbours, rank 0 is the best match
+    product_id = db.Column(db.Integer, primary_key=True)
+    rank = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    related_product_id = db.Column(db.Integer, nullable=False)
+    score = db.Column(db.Float, nullable=False)
+
+class Address(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
+    label = db.Column(db.String(50))
+    address = db.Column(db.String(200), nullable=False)
+    city = db.Column(db.String(100), nullable=False)
+    state = db.Column(db.String(100), nullable=False)
+    zip_code = db.Column(db.String(20), nullable=False)
+class Setting(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    site_name = db.Column(db.String(100))
+    contact_email = db.Column(db.String(100))
+    phone = db.Column(db.String(20))
+class DeliveryZone(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    city = db.Column(db.String(100), nullable=False)
+    state = db.Column(db.String(100), nullable=False)
+    pincode = db.Column(db.String(20), nullable=False, unique=True)
+
+
+def add_order_items(order, items):
+    """Add OrderItem rows for `order`, snapshotting product name and image."""
+    product_ids = {item['id'] for item in items}
+    products = {p.id: p for p in Product.query.filter(Product.id.in_(product_ids)).all()}
+
+    for item in items:
+        product = products.get(item['id'])
+        db.session.add(OrderItem(
+            order_id=order.id,
+            product_id=item['id'],
+            quantity=item['quantity'],
+            price=item['price'],
+            product_name=product.name if product else item.get('name'),
+            product_image=product.image if product else item.get('image')
+        ))
+
+
+def get_items_for_orders(order_ids, archived=False):
+    """Return {order_id: [item dict]} for all orders in one query.
+
+    Older rows without a snapshot fall back to the current product.
+    """
+    items_by_order = {order_id: [] for order_id in order_ids}
+    if not order_ids:
+        return items_by_order
+
+    item_model = ArchivedOrderItem if archived else OrderItem
+    rows = db.session.query(item_model, Product.name, Product.image) \
+        .outerjoin(Product, item_model.product_id == Product.id) \
+        .filter(item_model.order_id.in_(order_ids)) \
+        .order_by(item_model.id) \
+        .all()
+
+    for item, name, image in rows:
+        items_by_order[item.order_id].append({
+            'productId': item.product_id,
+            'name': item.product_name or name,
+            'image': item.product_image or image,
+            'quantity': item.quantity,
+            'price': item.price
+        })
+    return items_by_order
+
+
+def find_order(order_id):
+    """Look an order up by id in the hot table, then the archive."""
+    return Order.query.get(order_id) or ArchivedOrder.query.get(order_id)
+
+
+def user_order_rows(user_id, limit=None, offset=0):
+    """Return a user's orders from hot and archive tables, newest first.
+
+    Rows carry id, total_amount, status, created_at and an `archived` flag.
+    Each side is limited before the union so deep histories stay cheap.
+    """
+    def side(model, archived):
+        query = db.select(
+            model.id, model.total_amount, model.status, model.created_at,
+            db.literal(archived).label('archived')
+        ).where(model.user_id == user_id)
+        if limit is not None:
+            query = query.order_by(model.created_at.desc(), model.id.desc()).limit(offset + limit)
+        return query.subquery().select()
+
+    union = db.union_all(side(Order, False), side(ArchivedOrder, True)).subquery()
+    query = db.select(union).order_by(union.c.created_at.desc(), union.c.id.desc())
+    if limit is not None:
+        query = query.offset(offset).limit(limit)
+    return db.session.execute(query).all()
@@ -0,0 +1,121 @@
+"""Fan-out of live events (stock changes, order status) to SSE subscribers.
+
+`InProcessBroker` delivers within one process. `RedisBroker` publishes through
+a Redis channel and runs one listener per process that hands messages to a
+local `InProcessBroker`, so each worker keeps a single Redis connection no
+matter how many clients are subscribed to it. A `fake://` URL gives a
+`RedisBroker` backed by fakeredis: the same code path without a server, for
+development and tests (it is still confined to one process).
+"""
+import json
+import logging
+import queue
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class Subscription:
+    """A client's event queue plus the filter deciding what it receives."""
+
+    def __init__(self, broker, matches, maxsize=100):
+        self._broker = broker
+        self.matches = matches
+        self.queue = queue.Queue(maxsize=maxsize)
+
+    def get(self, timeout):
+        """Return the next event, or None after `timeout` seconds."""
+        try:
+            return self.queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def close(self):
+        self._broker.unsubscribe(self)
+
+
+class InProcessBroker:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscribers = set()
+
+    def subscribe(self, matches=lambda event: True, maxsize=100):
+        subscription = Subscription(self, matches, maxsize)
+        with self._lock:
+            self._subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            self._subscribers.discard(subscription)
+
+    def publish(self, event):
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for subscription in subscribers:
+            if not subscription.matches(event):
+                continue
+            try:
+                subscription.queue.put_nowait(event)
+            except queue.Full:
+                # A stalled client must not block publishers; it will refetch on reconnect
+                pass
+
+    def subscriber_count(self):
+        with self._lock:
+            return len(self._subscribers)
+
+
+class RedisBroker:
+    def __init__(self, url, channel='shopease:events'):
+        if url.startswith('fake://'):
+            import fakeredis
+
+            # Clients built from the same URL share one fake server
+            self._redis = fakeredis.FakeRedis.from_url('redis://' + url[len('fake://'):])
+        else:
+            import redis
+
+            self._redis = redis.Redis.from_url(url)
+        self._channel = channel
+        self._local = InProcessBroker()
+        self._listener = None
+        self._listener_lock = threading.Lock()
+
+    def subscribe(self, matches=lambda event: True, maxsize=100):
+        self._ensure_listener()
+        return self._local.subscribe(matches, maxsize)
+
+    def unsubscribe(self, subscription):
+        self._local.unsubscribe(subscription)
+
+    def publish(self, event):
+        self._redis.publish(self._channel, json.dumps(event))
+
+    def subscriber_count(self):
+        return self._local.subscriber_count()
+
+    def _ensure_listener(self):
+        with self._listener_lock:
+            if self._listener is None or not self._listener.is_alive():
+                self._listener = threading.Thread(target=self._listen, name='redis-events', daemon=True)
+                self._listener.start()
+
+    def _listen(self):
+        import redis
+
+        while True:
+            pubsub = self._redis.pubsub(ignore_subscribe_messages=True)
+            try:
+                pubsub.subscribe(self._channel)
+                for message in pubsub.listen():
+                    try:
+                        self._local.publish(json.loads(message['data']))
+                    except ValueError:
+                        logger.warning('Dropping malformed event on %s', self._channel)
+            except redis.ConnectionError:
+                logger.warning('Lost Redis event subscription, reconnecting', exc_info=True)
+                time.sleep(1)
+            finally:
+                pubsub.close()
@@ -0,0 +1,111 @@
+"""Frequently-bought-together recommendations.
+
+Builds a sparse product co-occurrence matrix from order line items and keeps
+the top-K neighbours per product. Nothing here touches Flask or the database:
+commands.py feeds in (order_id, product_id) arrays and stores the results.
+"""
+import os
+
+import numpy as np
+import scipy.sparse as sp
+
+SCORERS = ('lift', 'cosine')
+
+
+def build_cooccurrence(order_ids, product_ids, n_products):
+    """Return (cooccurrence, order_count) for the given line items.
+
+    `cooccurrence` is an n_products x n_products CSR matrix whose diagonal holds
+    the number of orders containing each product and whose off-diagonal entries
+    hold the number of orders containing both products. Duplicate lines for the
+    same product in one order are counted once.
+    """
+    order_ids = np.asarray(order_ids, dtype=np.int64)
+    product_ids = np.asarray(product_ids, dtype=np.int64)
+    if order_ids.size == 0:
+        return sp.csr_matrix((n_products, n_products), dtype=np.int64), 0
+
+    # Compact order ids to 0..n_orders-1 so the incidence matrix has no empty rows
+    order_index, order_rows = np.unique(order_ids, return_inverse=True)
+    incidence = sp.csr_matrix(
+        (np.ones(order_rows.size, dtype=np.int64), (order_rows, product_ids)),
+        shape=(order_index.size, n_products)
+    )
+    # Collapse repeated (order, product) lines into a single 0/1 entry
+    incidence.sum_duplicates()
+    incidence.data[:] = 1
+
+    cooccurrence = (incidence.T @ incidence).tocsr()
+    return cooccurrence, int(order_index.size)
+
+
+def resize(matrix, n_products):
+    """Grow a square sparse matrix to n_products x n_products."""
+    if matrix.shape[0] >= n_products:
+        return matrix
+    matrix = matrix.tocoo()
+    return sp.csr_matrix((matrix.data, (matrix.row, matrix.col)), shape=(n_products, n_products))
+
+
+def top_k(cooccurrence, order_count, k=10, scorer='lift', min_support=2, rows=None):
+    """Yield (product_id, [(related_id, score), ...]) best-first for each row.
+
+    `rows` limits scoring to the given product ids (used for incremental
+    updates); by default every product with at least one neighbour is scored.
+    """
+    if scorer not in SCORERS:
+        raise ValueError(f'Unknown scorer: {scorer}')
+
+    counts = cooccurrence.diagonal().astype(np.float64)
+    matrix = cooccurrence.tocsr()
+    if rows is None:
+        rows = np.flatnonzero(np.diff(matrix.indptr))
+
+    for row in rows:
+        start, end = matrix.indptr[row], matrix.indptr[row + 1]
+        cols = matrix.indices[start:end]
+        together = matrix.data[start:end].astype(np.float64)
+
+        keep = (cols != row) & (together >= min_support)
+        cols, together = cols[keep], together[keep]
+        if cols.size == 0:
+            yield int(row), []
+            continue
+
+        if scorer == 'lift':
+            scores = together * order_count / (counts[row] * counts[cols])
+        else:
+            scores = together / np.sqrt(counts[row] * counts[cols])
+
+        if cols.size > k:
+            best = np.argpartition(-scores, k - 1)[:k]
+        else:
+            best = np.arange(cols.size)
+        best = best[np.argsort(-scores[best], kind='stable')]
+
+        yield int(row), [(int(cols[i]), float(scores[i])) for i in best]
+
+
+def save_state(path, cooccurrence, order_count, last_order_id, counted_order_ids):
+    """Persist the matrix, high-water mark and recently counted order ids atomically."""
+    tmp_path = f'{path}.tmp.npz'
+    coo = cooccurrence.tocoo()
+    np.savez(
+        tmp_path,
+        row=coo.row, col=coo.col, data=coo.data, shape=np.array(coo.shape),
+        order_count=np.array(order_count), last_order_id=np.array(last_order_id),
+        counted_order_ids=np.asarray(counted_order_ids, dtype=np.int64)
+    )
+    os.replace(tmp_path, path)
+
+
+def load_state(path):
+    """Return (cooccurrence, order_count, last_order_id, counted_order_ids) or None if missing."""
+    if not os.path.exists(path):
+        return None
+    with np.load(path) as state:
+        shape = tuple(int(n) for n in state['shape'])
+        cooccurrence = sp.csr_matrix((state['data'], (state['row'], state['col'])), shape=shape)
+        counted = state['counted_order_ids'] if 'counted_order_ids' in state.files \
+            else np.empty(0, dtype=np.int64)
+        return cooccurrence, int(state['order_count']), int(state['last_order_id']), counted
@@ -0,0 +1,239 @@
+"""Access-token revocation.
+
+Every @jwt_required request checks the token against a per-worker Bloom
+filter holding revoked JTIs ("jti:<jti>") and users whose sessions were all
+revoked ("user:<id>"). Only a filter hit costs a DB query, so the common case
+(token not revoked) adds no query at all.
+
+Workers on the same host learn about new revocations from an append-only
+log file (one key per line) that each request checks with a single stat();
+workers on other hosts learn about them through the live-event broker when
+EVENTS_REDIS_URL is set. Every worker also rebuilds the filter from the DB
+every REVOCATION_REFRESH_SECONDS, which drops expired entries once
+`flask tokens compact` has removed them.
+"""
+import calendar
+import os
+import threading
+import time
+from datetime import datetime
+
+import click
+from flask import current_app
+from flask.cli import AppGroup
+
+from bloom import BloomFilter
+from extensions import db, jwt, get_event_broker, publish_event
+from models import User, RevokedToken
+
+
+def to_timestamp(dt):
+    return calendar.timegm(dt.utctimetuple())
+
+
+class RevocationList:
+    def __init__(self, app):
+        self._app = app
+        self._filter = None
+        self._built_at = 0
+        self._lock = threading.Lock()
+        self._listener = None
+        # Keys recorded while a rebuild is reading the DB, replayed into the new
+        # filter before it replaces the old one
+        self._pending = None
+        self._pending_lock = threading.Lock()
+        # Bytes of the revocation log already folded into the filter
+        self._log_offset = 0
+
+    def _record(self, key):
+        with self._pending_lock:
+            if self._filter is not None:
+                self._filter.add(key)
+            if self._pending is not None:
+                self._pending.append(key)
+
+    def _log_size(self):
+        try:
+            return os.stat(revocation_log_path(self._app)).st_size
+        except FileNotFoundError:
+            return 0
+
+    def _sync_log(self):
+        """Fold in keys other workers appended to the revocation log."""
+        size = self._log_size()
+        if size == self._log_offset:
+            return
+        with self._lock:
+            size = self._log_size()
+            if size < self._log_offset:
+                # Truncated by `flask tokens compact`: lines appended just before
+                # it may be gone, so take everything from the DB instead
+                self._rebuild()
+                return
+            with open(revocation_log_path(self._app), 'rb') as f:
+                f.seek(self._log_offset)
+                data = f.read(size - self._log_offset)
+            # Only whole lines; a partial one is picked up next time
+            end = data.rfind(b'\n') + 1
+            for key in data[:end].decode().split():
+                self._record(key)
+            self._log_offset += end
+
+    def _rebuild(self):
+        with self._pending_lock:
+            self._pending = []
+        # Log lines are appended after the DB commit, so everything up to here
+        # is already covered by the queries below
+        log_size = self._log_size()
+        now = datetime.utcnow()
+        jtis = [jti for (jti,) in db.session.query(RevokedToken.jti)
+                .filter(RevokedToken.expires_at > now)]
+        user_ids = [user_id for (user_id,) in db.session.query(User.id)
+                    .filter(User.sessions_revoked_at.isnot(None))]
+
+        config = self._app.config
+        capacity = max(config['REVOCATION_BLOOM_CAPACITY'], 2 * (len(jtis) + len(user_ids)))
+        bloom = BloomFilter(capacity, config['REVOCATION_BLOOM_ERROR_RATE'])
+        for jti in jtis:
+            bloom.add(f'jti:{jti}')
+        for user_id in user_ids:
+            bloom.add(f'user:{user_id}')
+
+        with self._pending_lock:
+            for key in self._pending:
+                bloom.add(key)
+            self._filter = bloom
+            self._pending = None
+        self._log_offset = log_size
+        self._built_at = time.monotonic()
+
+    def _needs_rebuild(self):
+        return self._filter is None or self._filter.full or \
+            time.monotonic() - self._built_at > self._app.config['REVOCATION_REFRESH_SECONDS']
+
+    def _ensure_fresh(self):
+        if self._needs_rebuild():
+            with self._lock:
+                if self._needs_rebuild():
+                    # Subscribe before reading the DB so no revocation slips in between
+                    self._start_listener()
+                    self._rebuild()
+
+    def _start_listener(self):
+        if self._listener is not None and self._listener.is_alive():
+            return
+        # Unbounded: unlike an SSE client, this subscriber must never drop events
+        subscription = get_event_broker().subscribe(
+            lambda event: event['type'] == 'revocation', maxsize=0)
+
+        def listen():
+            while True:
+                event = subscription.get(timeout=60)
+                if event:
+                    self._record(event['key'])
+
+        self._listener = threading.Thread(target=listen, name='revocation-listener', daemon=True)
+        self._listener.start()
+
+    def might_contain(self, key):
+        self._ensure_fresh()
+        self._sync_log()
+        return key in self._filter
+
+    def add(self, key):
+        """Record a revocation locally and tell the other workers."""
+        self._ensure_fresh()
+        self._record(key)
+        path = revocation_log_path(self._app)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # One small O_APPEND write, so concurrent writers never interleave lines
+        fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, f'{key}\n'.encode())
+        finally:
+            os.close(fd)
+        publish_event({'type': 'revocation', 'key': key})
+
+
+def revocation_log_path(app):
+    return app.config['REVOCATION_LOG_PATH'] or os.path.join(app.instance_path, 'revocations.log')
+
+
+def get_revocation_list():
+    revocations = current_app.extensions.get('revocation')
+    if revocations is None:
+        app = current_app._get_current_object()
+        revocations = app.extensions.setdefault('revocation', RevocationList(app))
+    return revocations
+
+
+def is_token_revoked(jwt_header, jwt_payload):
+    revocations = get_revocation_list()
+
+    jti = jwt_payload['jti']
+    if revocations.might_contain(f'jti:{jti}') and db.session.get(RevokedToken, jti):
+        return True
+
+    user_id = jwt_payload['sub']
+    if revocations.might_contain(f'user:{user_id}'):
+        user = db.session.get(User, int(user_id))
+        if user and user.sessions_revoked_at and \
+                jwt_payload['iat'] < to_timestamp(user.sessions_revoked_at):
+            return True
+
+    return False
+
+
+def revoke_token(jwt_payload):
+    """Revoke a single access token (logout)."""
+    db.session.merge(RevokedToken(
+        jti=jwt_payload['jti'],
+        user_id=int(jwt_payload['sub']),
+        expires_at=datetime.utcfromtimestamp(jwt_payload['exp'])
+    ))
+    db.session.commit()
+    get_revocation_list().add(f"jti:{jwt_payload['jti']}")
+
+
+def revoke_user_sessions(user):
+    """Revoke every token issued to `user` so far."""
+    # iat is in whole seconds and MySQL DATETIME rounds fractions, so store the
+    # cut-off truncated to the second: tokens from earlier seconds are rejected
+    # and a login in the same second as the revocation stays valid
+    user.sessions_revoked_at = datetime.utcnow().replace(microsecond=0)
+    db.session.commit()
+    get_revocation_list().add(f'user:{user.id}')
+
+
+def compact():
+    """Delete revocations that no longer matter because the tokens have expired.
+
+    Returns (tokens_removed, users_cleared).
+    """
+    now = datetime.utcnow()
+    tokens_removed = RevokedToken.query \
+        .filter(RevokedToken.expires_at <= now) \
+        .delete(synchronize_session=False)
+    users_cleared = User.query \
+        .filter(User.sessions_revoked_at <= now - current_app.config['JWT_ACCESS_TOKEN_EXPIRES']) \
+        .update({User.sessions_revoked_at: None}, synchronize_session=False)
+    db.session.commit()
+    # Every remaining revocation is in the DB, so the log can start over
+    path = revocation_log_path(current_app)
+    if os.path.exists(path):
+        os.truncate(path, 0)
+    return tokens_removed, users_cleared
+
+
+tokens_cli = AppGroup('tokens', help='Access-token revocation maintenance.')
+
+@tokens_cli.command('compact')
+def compact_command():
+    """Drop revocation entries for tokens that have expired anyway."""
+    tokens_removed, users_cleared = compact()
+    click.echo(f'Removed {tokens_removed} revoked tokens, cleared {users_cleared} user cut-offs')
+
+
+def init_app(app):
+    jwt.token_in_blocklist_loader(is_token_revoked)
+    app.cli.add_command(tokens_cli)
@@ -9,7 +9,19 @@ CREATE TABLE user (
     email VARCHAR(120) UNIQUE NOT NULL,
     password_hash VARCHAR(255) NOT NULL,
     role VARCHAR(20) DEFAULT 'user',
-    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    sessions_revoked_at DATETIME NULL,
+    INDEX ix_user_sessions_revoked_at (sessions_revoked_at)
+);
+
+-- Revoked access tokens (logout); expired rows are removed by `flask tokens compact`
+CREATE TABLE revoked_token (
+    jti VARCHAR(36) PRIMARY KEY,
+    user_id INT NOT NULL,
+    expires_at DATETIME NOT NULL,
+    revoked_at DATETIME,
+    FOREIGN KEY (user_id) REFERENCES user(id),
+    INDEX ix_revoked_token_expires_at (expires_at)
 );
 
 -- Products table
@@ -35,7 +47,8 @@ CREATE TABLE `order` (
     razorpay_payment_id VARCHAR(100),
     shipping_address JSON,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    FOREIGN KEY (user_id) REFERENCES user(id)
+    FOREIGN KEY (user_id) REFERENCES user(id),
+    INDEX ix_order_user_id_created_at (user_id, created_at)
 );
 
 -- Order items table
@@ -45,10 +58,46 @@ CREATE TABLE order_item (
     product_id INT NOT NULL,
     quantity INT NOT NULL,
     price DECIMAL(10,2) NOT NULL,
+    product_name VARCHAR(200),
+    product_image VARCHAR(500),
     FOREIGN KEY (order_id) REFERENCES `order`(id),
     FOREIGN KEY (product_id) REFERENCES product(id)
 );
 
+-- Archive of closed orders (moved by `flask orders archive`)
+CREATE TABLE order_archive (
+    id INT PRIMARY KEY,
+    user_id INT NOT NULL,
+    total_amount DECIMAL(10,2) NOT NULL,
+    status VARCHAR(20),
+    razorpay_order_id VARCHAR(100),
+    razorpay_payment_id VARCHAR(100),
+    shipping_address JSON,
+    created_at TIMESTAMP NULL,
+    archived_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (user_id) REFERENCES user(id),
+    INDEX ix_order_archive_user_id_created_at (user_id, created_at)
+);
+
+CREATE TABLE order_item_archive (
+    id INT PRIMARY KEY,
+    order_id INT NOT NULL,
+    product_id INT NOT NULL,
+    quantity INT NOT NULL,
+    price DECIMAL(10,2) NOT NULL,
+    product_name VARCHAR(200),
+    product_image VARCHAR(500),
+    FOREIGN KEY (order_id) REFERENCES order_archive(id),
+    FOREIGN KEY (product_id) REFERENCES product(id),
+    INDEX ix_order_item_archive_order_id (order_id)
+);
+
+CREATE TABLE order_archive_summary (
+    id INT PRIMARY KEY,
+    order_count INT NOT NULL DEFAULT 0,
+    revenue DECIMAL(12,2) NOT NULL DEFAULT 0
+);
+
 -- Addresses table
 CREATE TABLE address (
     id INT AUTO_INCREMENT PRIMARY KEY,
@@ -53,6 +53,13 @@ export const AuthProvider = ({ children }) => {
   }
 
   const logout = () => {
+    // Revoke the token server-side; local sign-out proceeds regardless
+    const token = localStorage.getItem('token')
+    if (token) {
+      axios.post('http://127.0.0.1:5000/api/auth/logout', null, {
+        headers: { Authorization: `Bearer ${token}` }
+      }).catch(() => {})
+    }
     localStorage.removeItem('token')
     delete axios.defaults.headers.common['Authorization']
     setUser(null)
@@ -6,18 +6,52 @@ import axios from 'axios'
 const Account = () => {
   const { user } = useAuth()
   const [orders, setOrders] = useState([])
+  const [ordersPage, setOrdersPage] = useState(1)
+  const [hasMoreOrders, setHasMoreOrders] = useState(false)
   const [addresses, setAddresses] = useState([])
   const [activeTab, setActiveTab] = useState('orders')
 
   useEffect(() => {
     fetchOrders()
     fetchAddresses()
+
+    // Live status updates for this user's orders. The stream opens with a
+    // short-lived ticket so the JWT never ends up in a URL
+    if (!localStorage.getItem('token')) return
+    let events
+    let stopped = false
+    const connect = async () => {
+      try {
+        const response = await axios.post('http://127.0.0.1:5000/api/events/ticket')
+        if (stopped) return
+        events = new EventSource(`http://127.0.0.1:5000/api/events?orders=true&ticket=${encodeURIComponent(response.data.ticket)}`)
+        events.addEventListener('order_status', (e) => {
+          const { orderId, status } = JSON.parse(e.data)
+          setOrders(prev => prev.map(order => order.id === orderId ? { ...order, status } : order))
+        })
+        events.onerror = () => {
+          // The browser gives up once the ticket has expired; fetch a new one
+          if (events.readyState === EventSource.CLOSED && !stopped) setTimeout(connect, 3000)
+        }
+      } catch (error) {
+        console.error('Error opening order updates:', error)
+      }
+    }
+    connect()
+    return () => {
+      stopped = true
+      events?.close()
+    }
   }, [])
 
-  const fetchOrders = async () => {
+  const fetchOrders = async (page = 1) => {
     try {
-      const response = await axios.get('http://127.0.0.1:5000/api/orders/user')
-      setOrders(response.data)
+      const response = await axios.get('http://127.0.0.1:5000/api/orders/history', {
+        params: { page, per_page: 10, expand: 'items' }
+      })
+      setOrders(prev => page === 1 ? response.data.orders : [...prev, ...response.data.orders])
+      setOrdersPage(page)
+      setHasMoreOrders(response.data.hasMore)
     } catch (error) {
       console.error('Error fetching orders:', error)
     }
@@ -100,9 +134,26 @@ const Account = () => {
                           {order.status}
                         </span>
                       </div>
+                      {order.items && order.items.length > 0 && (
+                        <ul className="text-sm text-gray-600 mb-2">
+                          {order.items.map(item => (
+                            <li key={item.productId}>
+                              {item.name || `Product #${item.productId}`} × {item.quantity}
+                            </li>
+                          ))}
+                        </ul>
+                      )}
                       <p className="text-lg font-semibold">${order.totalAmount}</p>
                     </div>
                   ))}
+                  {hasMoreOrders && (
+                    <button
+                      onClick={() => fetchOrders(ordersPage + 1)}
+                      className="w-full px-4 py-2 rounded-lg border hover:bg-gray-50 transition"
+                    >
+                      Load more orders
+                    </button>
+                  )}
                 </div>
               ) : (
                 <p className="text-gray-600">No orders found</p>
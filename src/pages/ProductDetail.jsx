@@ -1,5 +1,5 @@
 import  { useState, useEffect } from 'react'
-import { useParams } from 'react-router-dom'
+import { useParams, Link } from 'react-router-dom'
 import { Star, ShoppingCart, Plus, Minus } from 'lucide-react'
 import { useCart } from '../contexts/CartContext'
 import axios from 'axios'
@@ -7,12 +7,22 @@ import axios from 'axios'
 const ProductDetail = () => {
   const { id } = useParams()
   const [product, setProduct] = useState(null)
+  const [related, setRelated] = useState([])
   const [quantity, setQuantity] = useState(1)
   const [loading, setLoading] = useState(true)
   const { addItem } = useCart()
 
   useEffect(() => {
     fetchProduct()
+    fetchRelated()
+
+    // Live stock updates for this product
+    const events = new EventSource(`http://localhost:5000/api/events?products=${id}`)
+    events.addEventListener('stock', (e) => {
+      const { stock } = JSON.parse(e.data)
+      setProduct(prev => prev && { ...prev, stock })
+    })
+    return () => events.close()
   }, [id])
 
   const fetchProduct = async () => {
@@ -26,6 +36,15 @@ const ProductDetail = () => {
     }
   }
 
+  const fetchRelated = async () => {
+    try {
+      const response = await axios.get(`http://localhost:5000/api/products/${id}/related`)
+      setRelated(response.data)
+    } catch (error) {
+      console.error('Error fetching related products:', error)
+    }
+  }
+
   const handleAddToCart = () => {
     addItem(product, quantity)
     alert('Product added to cart!')
@@ -66,6 +85,10 @@ const ProductDetail = () => {
           <p className="text-4xl font-bold text-emerald-600 mb-6">${product.price}</p>
           
           <p className="text-gray-700 mb-6 leading-relaxed">{product.description}</p>
+
+          <p className={`mb-6 font-medium ${product.stock > 0 ? 'text-emerald-600' : 'text-red-600'}`}>
+            {product.stock > 0 ? `In stock (${product.stock} left)` : 'Out of stock'}
+          </p>
           
           <div className="mb-6">
             <h3 className="font-semibold mb-2">Category:</h3>
@@ -111,6 +134,29 @@ const ProductDetail = () => {
           </div>
         </div>
       </div>
+
+      {related.length > 0 && (
+        <div className="mt-12">
+          <h2 className="text-2xl font-bold mb-6">Frequently bought together</h2>
+          <div className="grid grid-cols-2 md:grid-cols-4 gap-6">
+            {related.map(item => (
+              <Link
+                key={item.id}
+                to={`/product/${item.id}`}
+                className="bg-white rounded-lg shadow-sm hover:shadow-md transition p-4"
+              >
+                <img
+                  src={item.image || 'https://images.unsplash.com/photo-1560472354-b33ff0c44a43?w=600'}
+                  alt={item.name}
+                  className="w-full h-40 object-cover rounded-lg mb-3"
+                />
+                <h3 className="font-semibold">{item.name}</h3>
+                <p className="text-emerald-600 font-bold">${item.price}</p>
+              </Link>
+            ))}
+          </div>
+        </div>
+      )}
     </div>
   )
 }